@@ -8,10 +8,10 @@
 - 密码修改
 - LLM 配置管理
 """
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from sqlmodel import Session
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlmodel import Session, update
 
 from app.config import settings
 from app.database import get_session
@@ -25,12 +25,18 @@ from app.schemas.auth import (
     UserRegister,
 )
 from app.services.auth_service import AuthService
+from app.utils.auth import get_password_hash, verify_password
 from app.utils.dependencies import get_current_user
+from app.utils.http_cache import cached_json_response
+from app.utils.rate_limit import limiter
+from app.utils.user_cache import invalidate_user_cache
 
 router = APIRouter(prefix="/api/auth", tags=["认证"])
 
-# 速率限制器，基于客户端 IP 地址
-limiter = Limiter(key_func=get_remote_address)
+# 配置在进程生命周期内不变，模块加载时计算一次
+_ACCESS_TOKEN_EXPIRE_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_DEFAULT_LLM_BASE_URL = settings.DEFAULT_LLM_BASE_URL
+_DEFAULT_LLM_MODEL = settings.DEFAULT_LLM_MODEL
 
 
 @router.post("/register", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
@@ -66,7 +72,7 @@ async def register(
                 "use_default_llm": user.use_default_llm,
                 "token": access_token,
                 "refresh_token": refresh_token,
-                "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+                "expires_in": _ACCESS_TOKEN_EXPIRE_SECONDS
             }
         )
     except HTTPException as e:
@@ -102,7 +108,7 @@ async def login(
                 "use_default_llm": user.use_default_llm,
                 "token": access_token,
                 "refresh_token": refresh_token,
-                "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+                "expires_in": _ACCESS_TOKEN_EXPIRE_SECONDS
             }
         )
     except HTTPException as e:
@@ -130,12 +136,16 @@ async def logout(
 
 @router.get("/me", response_model=AuthResponse)
 async def get_current_user_info(
+    request: Request,
     current_user: User = Depends(get_current_user)
-) -> AuthResponse:
+) -> Response:
     """
     获取当前用户信息
 
+    响应带 Cache-Control/ETag，短时间内重复请求可由浏览器缓存或 304 响应
+
     Args:
+        request: FastAPI 请求对象（用于读取 If-None-Match）
         current_user: 当前登录用户
 
     Returns:
@@ -144,9 +154,9 @@ async def get_current_user_info(
     # 根据是否使用默认 LLM 配置，决定返回的配置值
     llm_base_url = None if current_user.use_default_llm else current_user.llm_base_url
     llm_model = None if current_user.use_default_llm else current_user.llm_model
-    last_login = current_user.last_login_time.isoformat() if current_user.last_login_time else None
 
-    return AuthResponse(
+    # 数据均来自服务端，跳过 Pydantic 校验直接构造
+    response = AuthResponse.model_construct(
         success=True,
         message="获取成功",
         data={
@@ -159,9 +169,10 @@ async def get_current_user_info(
             "llm_base_url": llm_base_url,
             "llm_model": llm_model,
             "created_at": current_user.created_at.isoformat(),
-            "last_login_time": last_login
+            "last_login_time": current_user.last_login_time.isoformat() if current_user.last_login_time else None
         }
     )
+    return cached_json_response(request, response.model_dump())
 
 
 @router.put("/profile", response_model=AuthResponse)
@@ -181,26 +192,28 @@ async def update_profile(
     Returns:
         更新后的用户信息
     """
-    if profile_data.nickname:
-        current_user.nickname = profile_data.nickname
-    if profile_data.avatar_url:
-        current_user.avatar_url = profile_data.avatar_url
-
-    session.add(current_user)
-    session.commit()
-    session.refresh(current_user)
-
-    return AuthResponse(
-        success=True,
-        message="更新成功",
-        data={
-            "user_id": str(current_user.id),
-            "username": current_user.username,
-            "email": current_user.email,
-            "nickname": current_user.nickname,
-            "avatar_url": current_user.avatar_url
-        }
-    )
+    # 只写入实际发生变化的字段，前端重复提交相同资料时不产生写操作
+    values = {}
+    if profile_data.nickname and profile_data.nickname != current_user.nickname:
+        values["nickname"] = profile_data.nickname
+    if profile_data.avatar_url and profile_data.avatar_url != current_user.avatar_url:
+        values["avatar_url"] = profile_data.avatar_url
+
+    # 提交前用内存中的值构建响应，提交后无需再 refresh 查询
+    data = {
+        "user_id": str(current_user.id),
+        "username": current_user.username,
+        "email": current_user.email,
+        "nickname": values.get("nickname", current_user.nickname),
+        "avatar_url": values.get("avatar_url", current_user.avatar_url)
+    }
+
+    if values:
+        session.exec(update(User).where(User.id == current_user.id).values(**values))
+        session.commit()
+        await invalidate_user_cache(current_user.id)
+
+    return AuthResponse(success=True, message="更新成功", data=data)
 
 
 @router.put("/password", response_model=AuthResponse)
@@ -220,26 +233,30 @@ async def change_password(
     Returns:
         修改结果
     """
-    from app.utils.auth import get_password_hash, verify_password
-
-    if not verify_password(password_data.old_password, current_user.password_hash):
+    # bcrypt 计算耗时较长，放到线程池执行，避免阻塞事件循环
+    if not await asyncio.to_thread(verify_password, password_data.old_password, current_user.password_hash):
         return AuthResponse(success=False, message="原密码错误", error_code="INVALID_OLD_PASSWORD")
 
-    current_user.password_hash = get_password_hash(password_data.new_password)
-    session.add(current_user)
+    new_password_hash = await asyncio.to_thread(get_password_hash, password_data.new_password)
+    session.exec(update(User).where(User.id == current_user.id).values(password_hash=new_password_hash))
     session.commit()
+    await invalidate_user_cache(current_user.id)
 
     return AuthResponse(success=True, message="密码修改成功")
 
 
 @router.get("/llm-config", response_model=AuthResponse)
 async def get_llm_config(
+    request: Request,
     current_user: User = Depends(get_current_user)
-) -> AuthResponse:
+) -> Response:
     """
     获取当前用户的 LLM 配置
 
+    响应带 Cache-Control/ETag，短时间内重复请求可由浏览器缓存或 304 响应
+
     Args:
+        request: FastAPI 请求对象（用于读取 If-None-Match）
         current_user: 当前登录用户
 
     Returns:
@@ -247,8 +264,8 @@ async def get_llm_config(
     """
     if current_user.use_default_llm:
         # 使用系统默认配置
-        base_url = settings.DEFAULT_LLM_BASE_URL
-        model = settings.DEFAULT_LLM_MODEL
+        base_url = _DEFAULT_LLM_BASE_URL
+        model = _DEFAULT_LLM_MODEL
         has_custom_key = False
     else:
         # 使用用户自定义配置
@@ -256,7 +273,7 @@ async def get_llm_config(
         model = current_user.llm_model
         has_custom_key = bool(current_user.llm_api_key)
 
-    return AuthResponse(
+    response = AuthResponse.model_construct(
         success=True,
         message="获取成功",
         data={
@@ -266,6 +283,7 @@ async def get_llm_config(
             "has_custom_api_key": has_custom_key
         }
     )
+    return cached_json_response(request, response.model_dump())
 
 
 @router.put("/llm-config", response_model=AuthResponse)
@@ -288,13 +306,14 @@ async def update_llm_config(
     Returns:
         更新后的 LLM 配置
     """
-    current_user.use_default_llm = config.use_default_llm
-
     if config.use_default_llm:
         # 切换到默认配置，清空自定义配置
-        current_user.llm_api_key = None
-        current_user.llm_base_url = None
-        current_user.llm_model = None
+        values = {
+            "use_default_llm": True,
+            "llm_api_key": None,
+            "llm_base_url": None,
+            "llm_model": None
+        }
     else:
         # 使用自定义配置，API Key 必填
         if not config.llm_api_key:
@@ -303,20 +322,23 @@ async def update_llm_config(
                 message="使用自定义 LLM 配置时，API Key 为必填项",
                 error_code="MISSING_API_KEY"
             )
-        current_user.llm_api_key = config.llm_api_key
-        current_user.llm_base_url = config.llm_base_url or settings.DEFAULT_LLM_BASE_URL
-        current_user.llm_model = config.llm_model or settings.DEFAULT_LLM_MODEL
+        values = {
+            "use_default_llm": False,
+            "llm_api_key": config.llm_api_key,
+            "llm_base_url": config.llm_base_url or _DEFAULT_LLM_BASE_URL,
+            "llm_model": config.llm_model or _DEFAULT_LLM_MODEL
+        }
 
-    session.add(current_user)
+    session.exec(update(User).where(User.id == current_user.id).values(**values))
     session.commit()
-    session.refresh(current_user)
+    await invalidate_user_cache(current_user.id)
 
     return AuthResponse(
         success=True,
         message="LLM 配置更新成功",
         data={
-            "use_default_llm": current_user.use_default_llm,
-            "llm_base_url": current_user.llm_base_url or settings.DEFAULT_LLM_BASE_URL,
-            "llm_model": current_user.llm_model or settings.DEFAULT_LLM_MODEL
+            "use_default_llm": values["use_default_llm"],
+            "llm_base_url": values["llm_base_url"] or _DEFAULT_LLM_BASE_URL,
+            "llm_model": values["llm_model"] or _DEFAULT_LLM_MODEL
         }
     )
@@ -1,5 +1,6 @@
 """单词本管理API"""
 from fastapi import APIRouter, Depends, Query, HTTPException, BackgroundTasks
+from typing import Optional
 from sqlmodel import Session
 from app.database import get_session
 from app.schemas.collection import (
@@ -13,8 +14,10 @@ from app.schemas.collection import (
 from app.schemas.marketplace import MarketplaceBookImport
 from app.services.collection_service import CollectionService
 from app.services.word_service import WordService
-from app.utils.dependencies import get_current_user
-from app.models import User
+from app.utils.dependencies import get_current_user_cached
+from app.utils.user_cache import CachedUser
+from app.utils.ids import uuid7
+from app.utils.task_queue import enqueue_task
 import uuid as uuid_pkg
 
 router = APIRouter(prefix="/api/collections", tags=["单词本管理"])
@@ -24,7 +27,7 @@ router = APIRouter(prefix="/api/collections", tags=["单词本管理"])
 async def create_collection(
     collection_data: CollectionCreate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """创建单词本"""
     collection = await CollectionService.create_collection(
@@ -42,15 +45,17 @@ async def create_collection(
 async def get_collections(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="游标分页：上一页返回的 next_cursor，传入时忽略 page"),
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """获取用户的所有单词本"""
     result = await CollectionService.get_user_collections(
         user_id=current_user.id,
         page=page,
         page_size=page_size,
-        session=session
+        session=session,
+        cursor=cursor
     )
     return result
 
@@ -59,7 +64,7 @@ async def get_collections(
 async def get_collection(
     collection_id: uuid_pkg.UUID,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """获取单个单词本"""
     collection = await CollectionService.get_collection(
@@ -75,7 +80,7 @@ async def update_collection(
     collection_id: uuid_pkg.UUID,
     collection_data: CollectionUpdate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """更新单词本"""
     collection = await CollectionService.update_collection(
@@ -94,7 +99,7 @@ async def update_collection(
 async def delete_collection(
     collection_id: uuid_pkg.UUID,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """删除单词本（级联删除所有学习条目）"""
     await CollectionService.delete_collection(
@@ -113,28 +118,26 @@ async def import_words_to_collection(
     collection_id: uuid_pkg.UUID,
     import_request: WordsImportToCollection,
     background_tasks: BackgroundTasks,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """
     导入单词到指定单词本 (异步任务)
 
     - 提交后立即返回任务ID
-    - 后台进行去重、LLM生成和入库
-    - 完成后会发送站内消息通知
+    - 后台校验单词本归属，进行去重、LLM生成和入库
+    - 完成后会发送站内消息通知（单词本不存在时同样通过站内信告知）
     """
     # 验证 collection_id 匹配
     if import_request.collection_id != collection_id:
         raise HTTPException(status_code=400, detail="URL中的ID与请求体中的ID不一致")
 
-    # 简单验证单词本是否存在 (快速失败)
-    await CollectionService.get_collection(collection_id, current_user.id, session)
-
     # 生成任务ID
-    task_id = uuid_pkg.uuid4()
+    task_id = uuid7()
 
     # 添加后台任务
-    background_tasks.add_task(
+    await enqueue_task(
+        background_tasks,
+        "import_words",
         WordService.import_words_background_task,
         user_id=current_user.id,
         collection_id=collection_id,
@@ -153,7 +156,7 @@ async def import_marketplace_json(
     import_request: MarketplaceBookImport,
     background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """
     从 Marketplace JSON 导入并自动创建单词本 (异步任务)
@@ -173,14 +176,16 @@ async def import_marketplace_json(
     )
 
     # 2. 生成任务ID
-    task_id = uuid_pkg.uuid4()
+    task_id = uuid7()
 
     # 3. 添加后台任务
-    background_tasks.add_task(
+    await enqueue_task(
+        background_tasks,
+        "import_marketplace_book",
         WordService.import_marketplace_book_background_task,
         user_id=current_user.id,
         collection_id=collection.id,
-        marketplace_data=import_request.model_dump()
+        marketplace_json=import_request.model_dump_json()
     )
 
     return WordsImportTaskResponse(
@@ -195,8 +200,9 @@ async def get_collection_words(
     collection_id: uuid_pkg.UUID,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="游标分页：上一页返回的 next_cursor，传入时忽略 page"),
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """获取单词本中的所有单词（带学习进度）"""
     result = await CollectionService.get_collection_words(
@@ -204,6 +210,7 @@ async def get_collection_words(
         user_id=current_user.id,
         page=page,
         page_size=page_size,
-        session=session
+        session=session,
+        cursor=cursor
     )
     return result
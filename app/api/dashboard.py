@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends
 from sqlmodel import Session
 from app.database import get_session
-from app.utils.dependencies import get_current_user
-from app.models import User
+from app.utils.dependencies import get_current_user_cached
+from app.utils.user_cache import CachedUser
 from app.services.dashboard_service import DashboardService
 from app.schemas.dashboard import DashboardStatsResponse
 
@@ -11,7 +11,7 @@ router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
 @router.get("/stats", response_model=DashboardStatsResponse)
 async def get_dashboard_stats(
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """Get dashboard statistics for the current user"""
     stats = await DashboardService.get_stats(current_user.id, session)
@@ -7,11 +7,13 @@ from app.schemas.exam import (
     ExamGenerateRequest, ExamGenerateResponse,
     ExamLoadRequest, ExamLoadResponse,
     ExamSubmitRequest, ExamSubmitResponse,
-    ExamListResponse, ExamDetailResponse
+    ExamListResponse, ExamDetailResponse, ExamMode
 )
 from app.services.exam_service import ExamService
-from app.utils.dependencies import get_current_user
-from app.models import User
+from app.utils.dependencies import get_current_user_cached
+from app.utils.user_cache import CachedUser
+from app.utils.responses import PydanticResponse
+from app.utils.task_queue import enqueue_task
 import uuid as uuid_pkg
 
 router = APIRouter(prefix="/api/exam", tags=["考试"])
@@ -22,7 +24,7 @@ async def generate_exam(
     exam_data: ExamGenerateRequest,
     background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """
     生成考试（异步）
@@ -55,12 +57,13 @@ async def generate_exam(
 
         # 2. 批量添加后台任务
         for exam, item_ids in exam_data_list:
-            background_tasks.add_task(
-                ExamService.process_exam_generation,
+            await enqueue_task(
+                background_tasks,
+                "generate_exam",
+                ExamService.process_exam_generation_task,
                 exam_id=exam.id,
                 mode='complete',
                 target_count=exam.total_words,
-                session=session,
                 specific_item_ids=item_ids
             )
 
@@ -95,12 +98,13 @@ async def generate_exam(
     )
 
     # 2. 添加后台任务
-    background_tasks.add_task(
-        ExamService.process_exam_generation,
+    await enqueue_task(
+        background_tasks,
+        "generate_exam",
+        ExamService.process_exam_generation_task,
         exam_id=exam.id,
         mode=exam_data.mode,
-        target_count=exam_data.count,
-        session=session
+        target_count=exam_data.count
     )
 
     return ExamGenerateResponse(
@@ -110,29 +114,30 @@ async def generate_exam(
     )
 
 
-@router.get("/info", response_model=ExamListResponse)
+@router.get("/info", response_model=ExamListResponse, response_class=PydanticResponse)
 async def get_exam_list(
     page: int = 1,
     size: int = 20,
-    mode: Optional[str] = Query(None, description="考试模式筛选"),
+    mode: Optional[ExamMode] = Query(None, description="考试模式筛选"),
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """获取用户考试列表"""
-    return ExamService.get_user_exams(
+    result = ExamService.get_user_exams(
         user_id=current_user.id,
         page=page,
         size=size,
         session=session,
         mode=mode
     )
+    return PydanticResponse(ExamListResponse.model_construct(**result))
 
 
-@router.get("/detail", response_model=ExamDetailResponse)
+@router.get("/detail", response_model=ExamDetailResponse, response_class=PydanticResponse)
 async def get_exam_detail(
     exam_id: uuid_pkg.UUID = Query(..., description="考试ID"),
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """获取考试详情（包含预览/加载）"""
     exam_detail = ExamService.get_exam_detail(exam_id, session)
@@ -143,7 +148,8 @@ async def get_exam_detail(
     if exam_detail["user_id"] != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to view this exam")
 
-    return ExamDetailResponse(**exam_detail)
+    # 详情数据全部来自数据库，无需再次校验
+    return PydanticResponse(ExamDetailResponse.model_construct(**exam_detail))
 
 
 @router.post("/submit", response_model=ExamSubmitResponse)
@@ -151,7 +157,7 @@ async def submit_exam(
     submit_data: ExamSubmitRequest,
     background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """提交考试"""
     if submit_data.user_id != current_user.id:
@@ -162,13 +168,14 @@ async def submit_exam(
     ExamService.mark_exam_as_grading(submit_data.exam_id, session)
 
     # 后台处理考试评分
-    background_tasks.add_task(
-        ExamService.submit_exam,
+    await enqueue_task(
+        background_tasks,
+        "submit_exam",
+        ExamService.submit_exam_task,
         exam_id=submit_data.exam_id,
         user_id=current_user.id,
         wrong_word_ids=submit_data.wrong_words,
-        sentences_submission=submit_data.sentences,
-        session=session
+        sentences_submission=submit_data.sentences
     )
 
     return ExamSubmitResponse(
@@ -182,7 +189,7 @@ async def get_available_words_count(
     collection_id: uuid_pkg.UUID = Query(..., description="单词本ID"),
     mode: str = Query(..., description="考试模式：immediate/random/complete"),
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """获取指定单词本和模式下可用的单词数量"""
     available_count = ExamService.check_review_availability(
@@ -204,7 +211,7 @@ async def get_available_words_count(
 async def delete_exam(
     exam_id: uuid_pkg.UUID,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user_cached)
 ):
     """删除考试"""
     try:
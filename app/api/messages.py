@@ -1,106 +1,143 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select, func, desc
-from app.database import get_session
-from app.models.user import User
+from fastapi import APIRouter, HTTPException, Query
+from sqlalchemy import tuple_
+from sqlmodel import select, func, desc, update, delete
 from app.models.message import Message
-from app.utils.dependencies import get_current_user
+from app.schemas.message import MessageOut, MessagesPage
+from app.utils.dependencies import AsyncSessionDep, CachedUserDep
+from app.utils.pagination import encode_cursor, decode_cursor
 import uuid
 
 router = APIRouter(prefix="/api/messages", tags=["消息"])
 
-@router.get("/", response_model=dict)
-def get_messages(
+@router.get("/", response_model=MessagesPage)
+async def get_messages(
+    current_user: CachedUserDep,
+    session: AsyncSessionDep,
     page: int = 1,
     size: int = 20,
     unread_only: bool = False,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    cursor: Optional[str] = Query(None, description="游标分页：上一页返回的 next_cursor，传入时忽略 page，且不返回总数")
 ):
     """
     获取消息列表
     """
-    query = select(Message).where(Message.user_id == current_user.id)
+    # 使用窗口函数在分页查询中同时返回总数和未读数，一次往返完成
+    query = select(
+        Message.id,
+        Message.title,
+        Message.content,
+        Message.is_read,
+        Message.created_at,
+        func.count().over().label("total"),
+        func.count().filter(Message.is_read == False).over().label("unread_count")
+    ).where(Message.user_id == current_user.id)
 
     if unread_only:
         query = query.where(Message.is_read == False)
 
-    # 计算总数
-    count_query = select(func.count()).select_from(query.subquery())
-    total = session.exec(count_query).one()
-
-    # 获取分页数据，按时间倒序
-    query = query.order_by(desc(Message.created_at)).offset((page - 1) * size).limit(size)
-    messages = session.exec(query).all()
-
-    # 获取未读总数
-    unread_count_query = select(func.count()).where(Message.user_id == current_user.id, Message.is_read == False)
-    unread_count = session.exec(unread_count_query).one()
-
-    return {
-        "items": messages,
-        "total": total,
-        "page": page,
-        "size": size,
-        "unread_count": unread_count
-    }
+    # 获取分页数据，按时间倒序（id 作为同一时间的次序依据，保证游标翻页稳定）
+    query = query.order_by(desc(Message.created_at), desc(Message.id)).limit(size)
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        query = query.where(tuple_(Message.created_at, Message.id) < tuple_(cursor_created_at, cursor_id))
+    else:
+        query = query.offset((page - 1) * size)
+    rows = (await session.exec(query)).all()
+
+    # 只查询响应所需的列，在会话内直接构造 DTO，避免序列化 ORM 实例
+    messages = [MessageOut.model_construct(
+        id=row.id,
+        title=row.title,
+        content=row.content,
+        is_read=row.is_read,
+        created_at=row.created_at
+    ) for row in rows]
+    next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id) if len(rows) == size else None
+
+    if cursor:
+        # 游标模式下窗口函数只覆盖游标之后的行，不返回总数（由首页请求获取）
+        total, unread_count = None, None
+    elif rows:
+        total, unread_count = rows[0].total, rows[0].unread_count
+    elif page > 1:
+        # 页码超出范围时窗口函数没有行可附着，回退为单独统计
+        count_query = select(func.count()).where(Message.user_id == current_user.id)
+        if unread_only:
+            count_query = count_query.where(Message.is_read == False)
+        total = (await session.exec(count_query)).one()
+        unread_count_query = select(func.count()).where(Message.user_id == current_user.id, Message.is_read == False)
+        unread_count = (await session.exec(unread_count_query)).one()
+    else:
+        total, unread_count = 0, 0
+
+    return MessagesPage(
+        items=messages,
+        total=total,
+        page=page,
+        size=size,
+        unread_count=unread_count,
+        next_cursor=next_cursor
+    )
 
 @router.put("/{message_id}/read")
-def mark_as_read(
+async def mark_as_read(
     message_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    current_user: CachedUserDep,
+    session: AsyncSessionDep
 ):
     """
     标记单个消息为已读
     """
-    message = session.get(Message, message_id)
+    # 单条 UPDATE ... RETURNING 完成更新并取回消息，归属校验合并在 WHERE 条件中
+    statement = (
+        update(Message)
+        .where(Message.id == message_id, Message.user_id == current_user.id)
+        .values(is_read=True)
+        .returning(Message)
+    )
+    message = (await session.exec(statement)).scalar_one_or_none()
     if not message:
         raise HTTPException(status_code=404, detail="消息不存在")
 
-    if message.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="无法操作他人消息")
-
-    message.is_read = True
-    session.add(message)
-    session.commit()
-    session.refresh(message)
+    await session.commit()
     return message
 
 @router.put("/read-all")
-def mark_all_as_read(
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+async def mark_all_as_read(
+    current_user: CachedUserDep,
+    session: AsyncSessionDep
 ):
     """
     全部标记为已读
     """
-    statement = select(Message).where(Message.user_id == current_user.id, Message.is_read == False)
-    messages = session.exec(statement).all()
-
-    for message in messages:
-        message.is_read = True
-        session.add(message)
-
-    session.commit()
-    return {"count": len(messages), "status": "success"}
+    # 单条 UPDATE 语句在数据库端完成，无需加载每条消息；RETURNING 返回受影响的消息 ID，前端无需再次拉取列表
+    statement = (
+        update(Message)
+        .where(Message.user_id == current_user.id, Message.is_read == False)
+        .values(is_read=True)
+        .returning(Message.id)
+        .execution_options(synchronize_session=False)
+    )
+    ids = (await session.exec(statement)).scalars().all()
+
+    await session.commit()
+    return {"count": len(ids), "ids": ids, "status": "success"}
 
 @router.delete("/{message_id}")
-def delete_message(
+async def delete_message(
     message_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    current_user: CachedUserDep,
+    session: AsyncSessionDep
 ):
     """
     删除消息
     """
-    message = session.get(Message, message_id)
-    if not message:
+    # 归属校验合并在 WHERE 条件中，单条 DELETE 完成，无需先查询消息
+    statement = delete(Message).where(Message.id == message_id, Message.user_id == current_user.id)
+    result = await session.exec(statement)
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="消息不存在")
 
-    if message.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="无法操作他人消息")
-
-    session.delete(message)
-    session.commit()
+    await session.commit()
     return {"status": "success"}
@@ -1,13 +1,10 @@
 """学习模块API"""
-from fastapi import APIRouter, Depends, Query
-from sqlmodel import Session
-from app.database import get_session
+from fastapi import APIRouter, Query
 from app.schemas.study import (
     StudyMode, StudySessionResponse, StudySubmit, StudySubmitResponse
 )
 from app.services.study_service import StudyService
-from app.utils.dependencies import get_current_user
-from app.models import User
+from app.utils.dependencies import SessionDep, CachedUserDep
 import uuid as uuid_pkg
 
 router = APIRouter(prefix="/api/study", tags=["学习"])
@@ -15,10 +12,10 @@ router = APIRouter(prefix="/api/study", tags=["学习"])
 
 @router.get("/session", response_model=StudySessionResponse)
 async def get_study_session(
+    session: SessionDep,
+    current_user: CachedUserDep,
     mode: StudyMode = Query(..., description="学习模式"),
-    collection_id: uuid_pkg.UUID = Query(..., description="单词本ID"),
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    collection_id: uuid_pkg.UUID = Query(..., description="单词本ID")
 ):
     """获取学习会话"""
     result = await StudyService.get_study_session(
@@ -34,8 +31,8 @@ async def get_study_session(
 @router.post("/submit", response_model=StudySubmitResponse)
 async def submit_study(
     submit_data: StudySubmit,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    session: SessionDep,
+    current_user: CachedUserDep
 ):
     """提交学习结果"""
     result = await StudyService.submit_study(
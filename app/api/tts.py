@@ -1,24 +1,48 @@
 """TTS语音API"""
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import Response, JSONResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, ORJSONResponse
+from app.config import settings
 from app.services.tts_service import tts_service
+from app.utils.redis_client import get_redis
+import hashlib
 import logging
 
 router = APIRouter(prefix="/api/tts", tags=["TTS语音"])
 logger = logging.getLogger(__name__)
 
+# 音频缓存时间（30 天）；同一单词、音色、语速的音频内容不变
+_AUDIO_CACHE_SECONDS = 30 * 24 * 3600
+
 
 @router.get("/{word}")
-async def get_word_audio(word: str):
+async def get_word_audio(word: str, request: Request):
     """获取单词发音"""
+    cache_key = f"tts:{settings.TTS_VOICE}:{settings.TTS_RATE}:{word}"
+    etag = f'"{hashlib.md5(cache_key.encode()).hexdigest()}"'
+    headers = {
+        "Cache-Control": f"public, max-age={_AUDIO_CACHE_SECONDS}",
+        "ETag": etag
+    }
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    redis = get_redis()
+    if redis is not None:
+        try:
+            cached_audio = await redis.get(cache_key)
+            if cached_audio:
+                return Response(content=cached_audio, media_type="audio/mpeg", headers=headers)
+        except Exception as e:
+            logger.warning(f"TTS cache read failed for word '{word}': {str(e)}")
+
     try:
         audio_data = await tts_service.generate_audio(word)
-        return Response(content=audio_data, media_type="audio/mpeg")
     except Exception as e:
         logger.error(f"TTS error for word '{word}': {str(e)}")
         
         # 返回友好的错误信息而不是500错误
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "success": False,
@@ -27,3 +51,11 @@ async def get_word_audio(word: str):
                 "word": word
             }
         )
+
+    if redis is not None:
+        try:
+            await redis.set(cache_key, audio_data, ex=_AUDIO_CACHE_SECONDS)
+        except Exception as e:
+            logger.warning(f"TTS cache write failed for word '{word}': {str(e)}")
+
+    return Response(content=audio_data, media_type="audio/mpeg", headers=headers)
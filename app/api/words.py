@@ -1,23 +1,23 @@
-"""学习条目管理API（重构版：适配单词本分类管理）"""
-from fastapi import APIRouter, Depends, Query
-from sqlmodel import Session
-from app.database import get_session
+"""学习条目管理API（重构版：适配单词本分类管理）
+
+接口依赖同步的数据库会话，使用普通 def 声明，由 FastAPI 放到线程池执行，避免阻塞事件循环
+"""
+from fastapi import APIRouter, Query
 from app.services.word_service import WordService
-from app.utils.dependencies import get_current_user
-from app.models import User
+from app.utils.dependencies import SessionDep, CachedUserDep
 import uuid as uuid_pkg
 
 router = APIRouter(prefix="/api/items", tags=["学习条目管理"])
 
 
 @router.get("/{item_id}")
-async def get_word_item(
+def get_word_item(
     item_id: uuid_pkg.UUID,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    session: SessionDep,
+    current_user: CachedUserDep
 ):
     """获取学习条目详情"""
-    result = await WordService.get_word_item(
+    result = WordService.get_word_item(
         item_id=item_id,
         user_id=current_user.id,
         session=session
@@ -26,13 +26,13 @@ async def get_word_item(
 
 
 @router.delete("/{item_id}")
-async def delete_word_item(
+def delete_word_item(
     item_id: uuid_pkg.UUID,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    session: SessionDep,
+    current_user: CachedUserDep
 ):
     """删除学习条目（不删除wordbook中的单词）"""
-    await WordService.delete_word_item(
+    WordService.delete_word_item(
         item_id=item_id,
         user_id=current_user.id,
         session=session
@@ -1,13 +1,77 @@
+import time
+from collections import deque
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.config import settings
 
+# 连接获取耗时只保留最近的样本，用于 /debug/pool 计算分位数
+_ACQUIRE_SAMPLES = 1000
+
+
+class _TimedPoolMixin:
+    """记录每次从连接池获取连接的等待耗时（毫秒）"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.acquire_ms = deque(maxlen=_ACQUIRE_SAMPLES)
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.acquire_ms.append((time.perf_counter() - start) * 1000)
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
 # 创建数据库引擎
 engine = create_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
+    poolclass=TimedQueuePool,
+    echo=settings.SQL_ECHO,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE
+)
+
+
+def _async_database_url(url: str) -> str:
+    """将同步驱动的数据库 URL 转换为 asyncpg 驱动"""
+    for prefix in ("postgresql+psycopg2://", "postgresql://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+# 异步数据库引擎（asyncpg），用于已迁移为 async 的接口
+async_engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    poolclass=TimedAsyncAdaptedQueuePool,
+    echo=settings.SQL_ECHO,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE
+)
+
+async_session_maker = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False
 )
 
 
@@ -19,4 +83,38 @@ def create_db_and_tables():
 def get_session():
     """获取数据库会话"""
     with Session(engine) as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+async def get_async_session():
+    """获取异步数据库会话"""
+    async with async_session_maker() as session:
+        yield session
+
+
+def get_pool_status() -> dict:
+    """获取当前进程的连接池使用情况及最近获取连接耗时的分位数"""
+    def _percentile(samples: list, q: float) -> float:
+        return round(samples[int(q * (len(samples) - 1))], 3)
+
+    def _status(pool) -> dict:
+        samples = sorted(pool.acquire_ms)
+        acquire = {"samples": len(samples)}
+        if samples:
+            acquire.update(
+                p50=_percentile(samples, 0.50),
+                p95=_percentile(samples, 0.95),
+                max=round(samples[-1], 3)
+            )
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "acquire_ms": acquire
+        }
+
+    return {
+        "sync": _status(engine.pool),
+        "async": _status(async_engine.sync_engine.pool)
+    }
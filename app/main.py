@@ -8,27 +8,34 @@ FastAPI 主应用入口
 - 配置受保护的 API 文档访问
 - 应用生命周期管理
 """
+import logging
 import os
 import secrets
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
+
+import orjson
 
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from fastapi.openapi.utils import get_openapi
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
 from app.api import auth, collections, dashboard, exam, messages, study, tts, words
 from app.config import settings
-from app.database import create_db_and_tables
+from app.database import async_engine, create_db_and_tables, get_pool_status
+from app.utils.log_config import configure_logging
+from app.utils.rate_limit import limiter
+from app.utils.redis_client import close_redis
+from app.utils.task_queue import close_arq_pool
 
-# 创建速率限制器，基于客户端 IP 地址进行限制
-limiter = Limiter(key_func=get_remote_address)
+configure_logging()
+logger = logging.getLogger("wordmaster")
 
 
 @asynccontextmanager
@@ -39,30 +46,39 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     启动时：
     - 创建数据库表
     - 创建 TTS 缓存目录
-    - 打印启动信息
+    - 记录启动信息
+
+    关闭时：
+    - 关闭任务队列连接池和 Redis 客户端
+    - 释放异步数据库连接池
     """
     create_db_and_tables()
     os.makedirs(settings.TTS_CACHE_DIR, exist_ok=True)
 
-    print("🚀 WordMaster API 已启动")
-    print(f"📚 数据库: {settings.DATABASE_URL}")
-    print(f"🌐 允许的源: {settings.ALLOWED_ORIGINS}")
-    print(f"🤖 大模型: {settings.DEFAULT_LLM_MODEL}")
-    if settings.DEV_TOKEN:
-        print(f"📖 API 文档 (受保护): http://{settings.HOST}:{settings.PORT}/docs")
-    else:
-        print("⚠️ DEV_TOKEN 未配置，API 文档已禁用")
+    # 数据库地址只记录 @ 之后的主机部分，避免把账号密码写入日志
+    logger.info(
+        "WordMaster API 已启动 db=%s origins=%s llm_model=%s docs=%s",
+        settings.DATABASE_URL.rsplit("@", 1)[-1],
+        settings.allowed_origins_list,
+        settings.DEFAULT_LLM_MODEL,
+        "/docs (受保护)" if settings.DEV_TOKEN else "disabled",
+    )
 
     yield
 
+    await close_arq_pool()
+    await close_redis()
+    await async_engine.dispose()
+
 
-# 创建 FastAPI 应用实例，禁用默认文档路由（使用自定义受保护路由）
+# 创建 FastAPI 应用实例，禁用默认文档路由（使用自定义受保护路由），默认使用 orjson 序列化响应
 app = FastAPI(
     title="WordMaster API",
     version="1.0.0",
     docs_url=None,
     redoc_url=None,
     openapi_url=None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -122,22 +138,48 @@ def check_admin_auth(credentials: HTTPBasicCredentials = Depends(security)) -> s
     return credentials.username
 
 
-@app.get("/docs", include_in_schema=False)
 async def get_swagger_documentation(username: str = Depends(check_admin_auth)):
     """获取 Swagger UI 文档页面"""
     return get_swagger_ui_html(openapi_url="/openapi.json", title="WordMaster API - Docs")
 
 
-@app.get("/redoc", include_in_schema=False)
 async def get_redoc_documentation(username: str = Depends(check_admin_auth)):
     """获取 ReDoc 文档页面"""
     return get_redoc_html(openapi_url="/openapi.json", title="WordMaster API - ReDoc")
 
 
-@app.get("/openapi.json", include_in_schema=False)
+def custom_openapi() -> dict:
+    """生成 OpenAPI 规范，首次生成后缓存在 app.openapi_schema 中"""
+    if app.openapi_schema is None:
+        app.openapi_schema = get_openapi(title="WordMaster API", version="1.0.0", routes=app.routes)
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi
+
+# 序列化后的 OpenAPI 规范，路由在启动后不再变化，只需序列化一次
+_openapi_bytes: Optional[bytes] = None
+
+
 async def get_open_api_endpoint(username: str = Depends(check_admin_auth)):
     """获取 OpenAPI JSON 规范"""
-    return JSONResponse(get_openapi(title="WordMaster API", version="1.0.0", routes=app.routes))
+    global _openapi_bytes
+    if _openapi_bytes is None:
+        _openapi_bytes = orjson.dumps(app.openapi())
+    return Response(content=_openapi_bytes, media_type="application/json")
+
+
+# 仅在配置了 DEV_TOKEN 时注册文档路由；未配置时不注册，OpenAPI 规范也不会被生成
+if settings.DEV_TOKEN:
+    app.add_api_route("/docs", get_swagger_documentation, methods=["GET"], include_in_schema=False)
+    app.add_api_route("/redoc", get_redoc_documentation, methods=["GET"], include_in_schema=False)
+    app.add_api_route("/openapi.json", get_open_api_endpoint, methods=["GET"], include_in_schema=False)
+
+
+@app.get("/debug/pool", include_in_schema=False)
+async def get_database_pool_status(username: str = Depends(check_admin_auth)) -> dict:
+    """获取当前 worker 进程的数据库连接池使用情况（受保护）"""
+    return get_pool_status()
 
 
 @app.get("/")
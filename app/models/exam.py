@@ -1,13 +1,15 @@
 from typing import Optional, List
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 from sqlmodel import SQLModel, Field, ARRAY, Column
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from app.utils.ids import uuid7
 
 class Exam(SQLModel, table=True):
     __tablename__ = "exams"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     user_id: UUID = Field(foreign_key="users.id", index=True)
     collection_id: UUID = Field(foreign_key="word_collections.id", index=True)
     mode: str = Field(default="immediate") # immediate, random, complete
@@ -19,24 +21,45 @@ class Exam(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
 
+    __table_args__ = (
+        # 复习可用性/占用单词检查：按用户、状态、模式过滤
+        Index("idx_exams_user_status_mode", "user_id", "exam_status", "mode"),
+        # 考试列表：按用户过滤、按创建时间倒序
+        Index("idx_exams_user_created", "user_id", text("created_at DESC")),
+    )
+
 class ExamSpellingSection(SQLModel, table=True):
     __tablename__ = "exam_spelling_sections"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    exam_id: UUID = Field(foreign_key="exams.id")
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    # 删除考试时由数据库级联删除题目
+    exam_id: UUID = Field(
+        sa_column=Column(PG_UUID(as_uuid=True), ForeignKey("exams.id", ondelete="CASCADE"), nullable=False)
+    )
     word_id: UUID = Field(foreign_key="wordbook.id")
     item_id: UUID = Field(foreign_key="user_word_items.id")
     chinese_meaning: str
     english_answer: str
     created_at: datetime = Field(default_factory=datetime.now)
 
+    __table_args__ = (
+        Index("idx_exam_spelling_exam_id", "exam_id"),
+    )
+
 class ExamTranslationSection(SQLModel, table=True):
     __tablename__ = "exam_translation_sections"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    exam_id: UUID = Field(foreign_key="exams.id")
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    # 删除考试时由数据库级联删除题目
+    exam_id: UUID = Field(
+        sa_column=Column(PG_UUID(as_uuid=True), ForeignKey("exams.id", ondelete="CASCADE"), nullable=False)
+    )
     sentence_id: str
     chinese_sentence: str
     # SQLModel doesn't support ARRAY directly in all versions, using SA Column
     words_involved: List[UUID] = Field(sa_column=Column(ARRAY(PG_UUID)))
     created_at: datetime = Field(default_factory=datetime.now)
+
+    __table_args__ = (
+        Index("idx_exam_translation_exam_id", "exam_id"),
+    )
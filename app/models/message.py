@@ -1,13 +1,14 @@
 from sqlmodel import SQLModel, Field, Column
 from datetime import datetime
 import uuid as uuid_pkg
-from sqlalchemy import UUID
+from sqlalchemy import UUID, Index, text
+from app.utils.ids import uuid7
 
 class Message(SQLModel, table=True):
     __tablename__ = "messages"
 
     id: uuid_pkg.UUID = Field(
-        default_factory=uuid_pkg.uuid4,
+        default_factory=uuid7,
         sa_column=Column(UUID(as_uuid=True), primary_key=True)
     )
     user_id: uuid_pkg.UUID = Field(foreign_key="users.id", index=True)
@@ -15,3 +16,14 @@ class Message(SQLModel, table=True):
     content: str = Field(nullable=False)
     is_read: bool = Field(default=False, nullable=False)
     created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    __table_args__ = (
+        # 消息列表/未读数：按用户和已读状态过滤、按时间倒序
+        Index(
+            "idx_messages_user_read_created",
+            "user_id",
+            "is_read",
+            text("created_at DESC"),
+            text("id DESC")
+        ),
+    )
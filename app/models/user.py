@@ -3,13 +3,14 @@ from typing import Optional
 from datetime import datetime
 import uuid as uuid_pkg
 from sqlalchemy import UUID
+from app.utils.ids import uuid7
 
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
 
     id: uuid_pkg.UUID = Field(
-        default_factory=uuid_pkg.uuid4,
+        default_factory=uuid7,
         sa_column=Column(UUID(as_uuid=True), primary_key=True)
     )
     username: str = Field(max_length=50, unique=True, index=True, nullable=False)
@@ -3,13 +3,14 @@ from typing import Optional
 from datetime import datetime
 import uuid as uuid_pkg
 from sqlalchemy import UUID, ForeignKey
+from app.utils.ids import uuid7
 
 
 class UserSession(SQLModel, table=True):
     __tablename__ = "user_sessions"
 
     id: uuid_pkg.UUID = Field(
-        default_factory=uuid_pkg.uuid4,
+        default_factory=uuid7,
         sa_column=Column(UUID(as_uuid=True), primary_key=True)
     )
     user_id: uuid_pkg.UUID = Field(
@@ -1,8 +1,10 @@
-from sqlmodel import SQLModel, Field, Column
+from sqlmodel import SQLModel, Field, Column, Relationship
 from typing import Optional
 from datetime import datetime
 import uuid as uuid_pkg
-from sqlalchemy import UUID, ForeignKey, Integer, CheckConstraint
+from sqlalchemy import UUID, ForeignKey, Integer, CheckConstraint, Index
+from app.models.wordbook import WordBook
+from app.utils.ids import uuid7
 
 
 class UserWordItem(SQLModel, table=True):
@@ -10,7 +12,7 @@ class UserWordItem(SQLModel, table=True):
 
     # 四项 ID 设计
     id: uuid_pkg.UUID = Field(
-        default_factory=uuid_pkg.uuid4,
+        default_factory=uuid7,
         sa_column=Column(UUID(as_uuid=True), primary_key=True)
     )
     collection_id: uuid_pkg.UUID = Field(
@@ -34,6 +36,11 @@ class UserWordItem(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    # 关联的词库条目（单向多对一，按需 joinedload）
+    word: Optional[WordBook] = Relationship()
+
     __table_args__ = (
         CheckConstraint("status IN (0, 1, 2, 3, 4)", name="check_status"),
+        # 试卷生成/复习可用性统计：按用户、单词本、状态过滤
+        Index("idx_items_user_collection_status", "user_id", "collection_id", "status"),
     )
@@ -4,13 +4,14 @@ from datetime import datetime
 import uuid as uuid_pkg
 from sqlalchemy import UUID
 from sqlalchemy.dialects.postgresql import JSONB
+from app.utils.ids import uuid7
 
 
 class WordBook(SQLModel, table=True):
     __tablename__ = "wordbook"
 
     id: uuid_pkg.UUID = Field(
-        default_factory=uuid_pkg.uuid4,
+        default_factory=uuid7,
         sa_column=Column(UUID(as_uuid=True), primary_key=True)
     )
     word: str = Field(max_length=100, unique=True, index=True, nullable=False)
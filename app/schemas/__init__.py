@@ -1,3 +1,4 @@
+from app.schemas.base import ORMModel
 from app.schemas.auth import (
     UserRegister, UserLogin, TokenResponse, UserResponse,
     AuthResponse, ProfileUpdate, PasswordChange, RefreshTokenRequest,
@@ -12,7 +13,7 @@ from app.schemas.study import (
     StudySubmit, StudySubmitResponse
 )
 from app.schemas.exam import (
-    SpellingQuestion, TranslationQuestion,
+    ExamMode, SpellingQuestion, TranslationQuestion,
     ExamGenerateRequest, ExamGenerateResponse,
     ExamLoadRequest, ExamLoadResponse,
     ExamSubmitRequest, ExamSubmitResponse,
@@ -22,8 +23,10 @@ from app.schemas.collection import (
     CollectionCreate, CollectionUpdate, CollectionResponse,
     CollectionListResponse, WordsImportToCollection
 )
+from app.schemas.message import MessageOut, MessagesPage
 
 __all__ = [
+    "ORMModel",
     "UserRegister", "UserLogin", "TokenResponse", "UserResponse",
     "AuthResponse", "ProfileUpdate", "PasswordChange", "RefreshTokenRequest",
     "LLMConfigUpdate", "LLMConfigResponse",
@@ -31,11 +34,12 @@ __all__ = [
     "WordListResponse",
     "StudyMode", "StudyWord", "StudySessionResponse",
     "StudySubmit", "StudySubmitResponse",
-    "SpellingQuestion", "TranslationQuestion",
+    "ExamMode", "SpellingQuestion", "TranslationQuestion",
     "ExamGenerateRequest", "ExamGenerateResponse",
     "ExamLoadRequest", "ExamLoadResponse",
     "ExamSubmitRequest", "ExamSubmitResponse",
     "ExamInfo", "ExamListResponse", "ExamDetailResponse",
     "CollectionCreate", "CollectionUpdate", "CollectionResponse",
-    "CollectionListResponse", "WordsImportToCollection"
+    "CollectionListResponse", "WordsImportToCollection",
+    "MessageOut", "MessagesPage"
 ]
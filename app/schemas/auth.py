@@ -1,10 +1,17 @@
 from pydantic import BaseModel, EmailStr, Field, field_validator
+from app.schemas.base import ORMModel
 from typing import Optional
-import uuid as uuid_pkg
+from uuid import UUID
 from datetime import datetime
 import re
 
 
+# 预编译校验用的正则，避免每次校验时查找正则缓存
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+_HAS_ALPHA_RE = re.compile(r'[a-zA-Z]')
+_HAS_DIGIT_RE = re.compile(r'\d')
+
+
 class UserRegister(BaseModel):
     username: str = Field(..., min_length=3, max_length=50)
     email: EmailStr
@@ -14,14 +21,20 @@ class UserRegister(BaseModel):
     @field_validator('username')
     @classmethod
     def validate_username(cls, v):
-        if not re.match(r'^[a-zA-Z0-9_]+$', v):
+        if not _USERNAME_RE.match(v):
             raise ValueError('用户名只能包含字母、数字和下划线')
         return v
 
+    @field_validator('email')
+    @classmethod
+    def normalize_email(cls, v):
+        # 邮箱统一小写存储，解析请求时处理一次
+        return v.lower()
+
     @field_validator('password')
     @classmethod
     def validate_password(cls, v):
-        if not re.search(r'[a-zA-Z]', v) or not re.search(r'\d', v):
+        if not _HAS_ALPHA_RE.search(v) or not _HAS_DIGIT_RE.search(v):
             raise ValueError('密码必须包含至少一个字母和一个数字')
         return v
 
@@ -39,8 +52,8 @@ class TokenResponse(BaseModel):
     token_type: str = "Bearer"
 
 
-class UserResponse(BaseModel):
-    user_id: uuid_pkg.UUID
+class UserResponse(ORMModel):
+    user_id: UUID
     username: str
     email: str
     nickname: Optional[str]
@@ -71,7 +84,7 @@ class PasswordChange(BaseModel):
     @field_validator('new_password')
     @classmethod
     def validate_new_password(cls, v):
-        if not re.search(r'[a-zA-Z]', v) or not re.search(r'\d', v):
+        if not _HAS_ALPHA_RE.search(v) or not _HAS_DIGIT_RE.search(v):
             raise ValueError('密码必须包含至少一个字母和一个数字')
         return v
 
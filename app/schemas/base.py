@@ -0,0 +1,7 @@
+"""Schema 公共基类"""
+from pydantic import BaseModel, ConfigDict
+
+
+class ORMModel(BaseModel):
+    """可直接由 ORM 对象构建的响应模型基类"""
+    model_config = ConfigDict(from_attributes=True)
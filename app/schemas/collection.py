@@ -1,8 +1,9 @@
 """单词本相关的 Schema"""
 from pydantic import BaseModel, Field
+from app.schemas.base import ORMModel
 from typing import Optional
 from datetime import datetime
-import uuid as uuid_pkg
+from uuid import UUID
 
 
 # 创建单词本请求
@@ -22,9 +23,9 @@ class CollectionUpdate(BaseModel):
 
 
 # 单词本响应
-class CollectionResponse(BaseModel):
-    id: uuid_pkg.UUID
-    user_id: uuid_pkg.UUID
+class CollectionResponse(ORMModel):
+    id: UUID
+    user_id: UUID
     name: str
     description: Optional[str]
     color: Optional[str]
@@ -33,9 +34,6 @@ class CollectionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # 单词本列表响应
 class CollectionListResponse(BaseModel):
@@ -43,11 +41,12 @@ class CollectionListResponse(BaseModel):
     collections: list[CollectionResponse]
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 # 导入单词到单词本请求
 class WordsImportToCollection(BaseModel):
-    collection_id: uuid_pkg.UUID = Field(..., description="目标单词本ID")
+    collection_id: UUID = Field(..., description="目标单词本ID")
     words: list[str] = Field(..., min_items=1, description="单词列表")
 
 
@@ -55,4 +54,4 @@ class WordsImportToCollection(BaseModel):
 class WordsImportTaskResponse(BaseModel):
     success: bool
     message: str
-    task_id: uuid_pkg.UUID
\ No newline at end of file
+    task_id: UUID
\ No newline at end of file
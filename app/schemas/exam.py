@@ -1,12 +1,16 @@
 from pydantic import BaseModel
-from typing import List, Dict, Optional
+from app.schemas.base import ORMModel
+from typing import List, Dict, Literal, Optional
 from datetime import datetime
-import uuid as uuid_pkg
+from uuid import UUID
+
+# 考试模式：random / complete / immediate
+ExamMode = Literal["random", "complete", "immediate"]
 
 # --- Basic Section Models ---
 class SpellingQuestion(BaseModel):
-    word_id: uuid_pkg.UUID
-    item_id: Optional[uuid_pkg.UUID] = None
+    word_id: UUID
+    item_id: Optional[UUID] = None
     chinese: str
     english_answer: Optional[str] = None # Include answer for frontend validation
 
@@ -14,25 +18,25 @@ class TranslationQuestion(BaseModel):
     sentence_id: str
     # When loading, we send chinese sentence, user inputs english
     chinese: str
-    words_involved: List[uuid_pkg.UUID]
+    words_involved: List[UUID]
 
 # --- Request Models ---
 class ExamGenerateRequest(BaseModel):
     # user_id comes from token usually, but existing API might ask for it explicitly?
     # Keeping it optional or as per design. Design says user_id is in body.
-    user_id: Optional[uuid_pkg.UUID] = None
-    collection_id: uuid_pkg.UUID
-    mode: str # random, complete, immediate
+    user_id: Optional[UUID] = None
+    collection_id: UUID
+    mode: ExamMode
     count: int = 20
 
 class ExamLoadRequest(BaseModel):
-    exam_id: uuid_pkg.UUID
+    exam_id: UUID
 
 class ExamSubmitRequest(BaseModel):
-    exam_id: uuid_pkg.UUID
-    user_id: Optional[uuid_pkg.UUID] = None
-    collection_id: uuid_pkg.UUID
-    wrong_words: List[uuid_pkg.UUID]
+    exam_id: UUID
+    user_id: Optional[UUID] = None
+    collection_id: UUID
+    wrong_words: List[UUID]
     # Sentence info submitted back for verification/record?
     # Design says: sentences: [{sentence_id, chinese, english, words_involved}]
     # But usually we submit answers. The design implies we submit the *result* or the *answer*?
@@ -50,7 +54,7 @@ class ExamGenerateResponse(BaseModel):
     exam_generation_status: str
 
 class ExamLoadResponse(BaseModel):
-    exam_id: uuid_pkg.UUID
+    exam_id: UUID
     spelling_section: List[SpellingQuestion]
     translation_section: List[TranslationQuestion]
 
@@ -60,9 +64,9 @@ class ExamSubmitResponse(BaseModel):
 
 # --- List/Info Models ---
 
-class ExamInfo(BaseModel):
-    exam_id: uuid_pkg.UUID
-    user_id: uuid_pkg.UUID
+class ExamInfo(ORMModel):
+    exam_id: UUID
+    user_id: UUID
     collection_name: Optional[str] = None
     total_words: int
     spelling_words_count: int
@@ -76,10 +80,10 @@ class ExamListResponse(BaseModel):
     exams: List[ExamInfo]
     pagination: Dict[str, int]
 
-class ExamDetailResponse(BaseModel):
-    exam_id: uuid_pkg.UUID
-    user_id: uuid_pkg.UUID
-    collection_id: uuid_pkg.UUID
+class ExamDetailResponse(ORMModel):
+    exam_id: UUID
+    user_id: UUID
+    collection_id: UUID
     collection_name: Optional[str] = None
     exam_status: str
     total_words: int
@@ -0,0 +1,26 @@
+"""站内消息相关的 Schema"""
+from pydantic import BaseModel
+from app.schemas.base import ORMModel
+from typing import List, Optional
+from datetime import datetime
+from uuid import UUID
+
+
+# 消息响应
+class MessageOut(ORMModel):
+    id: UUID
+    title: str
+    content: str
+    is_read: bool
+    created_at: datetime
+
+
+# 消息列表响应
+class MessagesPage(BaseModel):
+    items: List[MessageOut]
+    # 游标分页模式下为 None
+    total: Optional[int]
+    page: int
+    size: int
+    unread_count: Optional[int]
+    next_cursor: Optional[str] = None
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
+from app.schemas.base import ORMModel
 from typing import List, Optional
-import uuid as uuid_pkg
+from uuid import UUID
 from enum import Enum
 
 
@@ -11,9 +12,9 @@ class StudyMode(str, Enum):
     FINAL = "final"
 
 
-class StudyWord(BaseModel):
-    item_id: uuid_pkg.UUID
-    word_id: uuid_pkg.UUID
+class StudyWord(ORMModel):
+    item_id: UUID
+    word_id: UUID
     word: str
     chinese: str
     phonetic: str
@@ -30,7 +31,7 @@ class StudySessionResponse(BaseModel):
 
 
 class StudySubmit(BaseModel):
-    item_id: uuid_pkg.UUID
+    item_id: UUID
     user_input: str
     is_skip: bool = False
 
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
+from app.schemas.base import ORMModel
 from typing import List, Dict, Any, Optional
-import uuid as uuid_pkg
+from uuid import UUID
 from datetime import datetime
 
 
@@ -22,8 +23,8 @@ class WordImportResponse(BaseModel):
     task_id: Optional[str] = None
 
 
-class WordResponse(BaseModel):
-    id: uuid_pkg.UUID
+class WordResponse(ORMModel):
+    id: UUID
     word: str
     content: Dict[str, Any]
     status: Optional[int] = None
@@ -1,4 +1,10 @@
 """认证服务"""
+import asyncio
+import hashlib
+import hmac
+
+from cachetools import TTLCache
+from sqlalchemy import delete, or_, update
 from sqlmodel import Session, select
 from app.models import User, UserSession
 from app.schemas.auth import UserRegister, UserLogin
@@ -7,53 +13,90 @@ from app.utils.auth import (
     verify_password, 
     create_access_token, 
     create_refresh_token,
-    hash_token
+    hash_token,
+    is_known_password_hash,
+    DUMMY_PASSWORD_HASH
 )
 from datetime import datetime, timedelta
 from app.config import settings
+from app.utils.user_cache import invalidate_user_cache
 from fastapi import HTTPException, status
 from typing import Tuple, Optional
 import uuid as uuid_pkg
 
 
+# 登录密码校验缓存：短时间内重复登录时跳过 bcrypt 计算
+# 键包含密码哈希，修改密码后旧缓存自然失效；只缓存校验成功的结果
+_verified_login_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+# 错误提示
+_ERR_USERNAME_TAKEN = "用户名已存在"
+_ERR_EMAIL_TAKEN = "邮箱已存在"
+_ERR_INVALID_CREDENTIALS = "用户名或密码错误"
+
+# 会话有效期（配置在进程内不变，预先构造）
+_ACCESS_TD = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TD = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+
+def _login_cache_key(user: User, password: str) -> bytes:
+    """生成登录缓存键（HMAC，避免明文密码驻留内存）"""
+    message = f"{user.id}:{user.password_hash}:{password}".encode("utf-8")
+    return hmac.new(settings.SECRET_KEY.encode("utf-8"), message, hashlib.sha256).digest()
+
+
 class AuthService:
+    @staticmethod
+    async def verify_login_password(user: User, password: str) -> bool:
+        """校验登录密码，命中缓存时直接返回，未命中则在线程池中执行 bcrypt"""
+        cache_key = _login_cache_key(user, password)
+        if cache_key in _verified_login_cache:
+            return True
+
+        verified = await asyncio.to_thread(verify_password, password, user.password_hash)
+        if verified:
+            _verified_login_cache[cache_key] = True
+        return verified
+
     @staticmethod
     async def register_user(
         user_data: UserRegister, 
         session: Session
     ) -> Tuple[User, str, str]:
         """注册用户"""
-        # 检查用户名是否存在
-        statement = select(User).where(User.username == user_data.username)
-        existing_user = session.exec(statement).first()
-        if existing_user:
+        # 用户名和邮箱一次查询，在 Python 中区分冲突字段
+        statement = select(User.username, User.email).where(
+            or_(User.username == user_data.username, User.email == user_data.email)
+        )
+        existing = session.exec(statement).all()
+        if any(username == user_data.username for username, _ in existing):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="用户名已存在"
+                detail=_ERR_USERNAME_TAKEN
             )
-        
-        # 检查邮箱是否存在
-        email_lower = user_data.email.lower()
-        statement = select(User).where(User.email == email_lower)
-        existing_email = session.exec(statement).first()
-        if existing_email:
+        if existing:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="邮箱已存在"
+                detail=_ERR_EMAIL_TAKEN
             )
 
+        # bcrypt 计算耗时（随 BCRYPT_ROUNDS 增加），放到线程中执行，避免阻塞事件循环
+        password_hash = await asyncio.to_thread(get_password_hash, user_data.password)
+
+        now = datetime.utcnow()
+
         # 创建用户
         user = User(
             username=user_data.username,
-            email=email_lower,
-            password_hash=get_password_hash(user_data.password),
+            email=user_data.email,
+            password_hash=password_hash,
             nickname=user_data.nickname or user_data.username,
-            last_login_time=datetime.utcnow()
+            last_login_time=now
         )
         
+        # 先 flush 写入用户，会话记录与其在同一事务中提交
         session.add(user)
-        session.commit()
-        session.refresh(user)
+        session.flush()
         
         # 创建令牌
         access_token = create_access_token({"sub": str(user.id)})
@@ -64,7 +107,7 @@ class AuthService:
             user_id=user.id,
             token=hash_token(access_token),
             refresh_token=hash_token(refresh_token),
-            expires_at=datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+            expires_at=now + _ACCESS_TD
         )
         session.add(user_session)
         session.commit()
@@ -83,21 +126,32 @@ class AuthService:
         )
         user = session.exec(statement).first()
         
-        if not user or not verify_password(login_data.password, user.password_hash):
+        if not user or not is_known_password_hash(user.password_hash):
+            # 用户不存在或哈希格式无法识别时，只对占位哈希执行一次 bcrypt 校验，
+            # 保持失败耗时一致，避免通过响应耗时枚举账号
+            await asyncio.to_thread(verify_password, login_data.password, DUMMY_PASSWORD_HASH)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="用户名或密码错误"
+                detail=_ERR_INVALID_CREDENTIALS
             )
         
-        # 更新最后登录时间
-        user.last_login_time = datetime.utcnow()
-        session.add(user)
-        session.commit()
+        if not await AuthService.verify_login_password(user, login_data.password):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=_ERR_INVALID_CREDENTIALS
+            )
+        
+        now = datetime.utcnow()
+
+        # 更新最后登录时间，与会话写入同一事务提交
+        session.exec(
+            update(User)
+            .where(User.id == user.id)
+            .values(last_login_time=now)
+        )
         
         # 创建令牌
-        expires_delta = None
-        if login_data.remember_me:
-            expires_delta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        expires_delta = _REFRESH_TD if login_data.remember_me else _ACCESS_TD
         
         access_token = create_access_token({"sub": str(user.id)}, expires_delta)
         refresh_token = create_refresh_token({"sub": str(user.id)})
@@ -107,19 +161,19 @@ class AuthService:
             user_id=user.id,
             token=hash_token(access_token),
             refresh_token=hash_token(refresh_token),
-            expires_at=datetime.utcnow() + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
+            expires_at=now + expires_delta
         )
         session.add(user_session)
         session.commit()
+        # 最后登录时间已变化
+        await invalidate_user_cache(user.id)
         
         return user, access_token, refresh_token
     
     @staticmethod
     async def logout_user(user: User, session: Session):
         """用户登出"""
-        # 删除所有会话
-        statement = select(UserSession).where(UserSession.user_id == user.id)
-        sessions = session.exec(statement).all()
-        for user_session in sessions:
-            session.delete(user_session)
+        # 删除所有会话（单条 DELETE）
+        session.exec(delete(UserSession).where(UserSession.user_id == user.id))
         session.commit()
+        await invalidate_user_cache(user.id)
@@ -1,12 +1,17 @@
 """单词本管理服务"""
 from sqlmodel import Session, select
-from sqlalchemy import func
-from app.models import WordCollection, UserWordItem, WordBook
-from typing import Dict, Any
+from sqlalchemy.orm import joinedload
+from sqlalchemy import exists, func, tuple_
+from app.models import WordCollection, UserWordItem
+from app.utils.pagination import encode_cursor, decode_cursor
+from typing import Dict, Any, Optional
 import uuid as uuid_pkg
 from fastapi import HTTPException
 
 
+_ERR_COLLECTION_NOT_FOUND = "单词本不存在"
+
+
 class CollectionService:
     @staticmethod
     async def create_collection(
@@ -36,48 +41,62 @@ class CollectionService:
         user_id: uuid_pkg.UUID,
         page: int,
         page_size: int,
-        session: Session
+        session: Session,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
-        """获取用户的所有单词本"""
-        # 计算偏移量
-        offset = (page - 1) * page_size
-
-        # 使用聚合查询同时获取单词本和单词数量
+        """获取用户的所有单词本（传入 cursor 时使用游标分页，忽略 page）"""
+        # 使用聚合查询同时获取单词本、单词数量和单词本总数（窗口函数在 GROUP BY 之后计算）
         statement = (
-            select(WordCollection, func.count(UserWordItem.id))
+            select(WordCollection, func.count(UserWordItem.id), func.count().over())
             .outerjoin(UserWordItem, WordCollection.id == UserWordItem.collection_id)
             .where(WordCollection.user_id == user_id)
             .group_by(WordCollection.id)
-            .offset(offset)
+            .order_by(WordCollection.created_at.desc(), WordCollection.id.desc())
             .limit(page_size)
-            .order_by(WordCollection.created_at.desc())
         )
 
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+            statement = statement.where(
+                tuple_(WordCollection.created_at, WordCollection.id) < tuple_(cursor_created_at, cursor_id)
+            )
+        else:
+            statement = statement.offset((page - 1) * page_size)
+
         results = session.exec(statement).all()
 
         collections = []
-        for collection, count in results:
+        for collection, count, _ in results:
             collection.word_count = count
             collections.append(collection)
 
-        # 统计总数
-        count_statement = select(func.count()).select_from(WordCollection).where(WordCollection.user_id == user_id)
-        total = session.exec(count_statement).one()
+        next_cursor = None
+        if len(collections) == page_size:
+            last = collections[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        # 游标模式下窗口总数只覆盖游标之后的行；页为空时无法取得窗口总数，两者都回退到单独统计
+        if results and not cursor:
+            total = results[0][2]
+        else:
+            count_statement = select(func.count()).select_from(WordCollection).where(WordCollection.user_id == user_id)
+            total = session.exec(count_statement).one()
 
         return {
             "total": total,
             "collections": collections,
             "page": page,
-            "page_size": page_size
+            "page_size": page_size,
+            "next_cursor": next_cursor
         }
 
     @staticmethod
-    async def get_collection(
+    async def _get_collection_no_count(
         collection_id: uuid_pkg.UUID,
         user_id: uuid_pkg.UUID,
         session: Session
     ) -> WordCollection:
-        """获取单个单词本"""
+        """获取单个单词本（校验所有权，不统计单词数）"""
         statement = select(WordCollection).where(
             WordCollection.id == collection_id,
             WordCollection.user_id == user_id
@@ -85,7 +104,18 @@ class CollectionService:
         collection = session.exec(statement).first()
 
         if not collection:
-            raise HTTPException(status_code=404, detail="单词本不存在")
+            raise HTTPException(status_code=404, detail=_ERR_COLLECTION_NOT_FOUND)
+
+        return collection
+
+    @staticmethod
+    async def get_collection(
+        collection_id: uuid_pkg.UUID,
+        user_id: uuid_pkg.UUID,
+        session: Session
+    ) -> WordCollection:
+        """获取单个单词本"""
+        collection = await CollectionService._get_collection_no_count(collection_id, user_id, session)
 
         # 动态计算word_count
         count_statement = select(func.count()).select_from(UserWordItem).where(
@@ -96,6 +126,20 @@ class CollectionService:
 
         return collection
 
+    @staticmethod
+    async def assert_exists(
+        collection_id: uuid_pkg.UUID,
+        user_id: uuid_pkg.UUID,
+        session: Session
+    ):
+        """校验单词本存在且属于该用户（EXISTS 探测，不加载整行、不统计单词数）"""
+        statement = select(exists().where(
+            WordCollection.id == collection_id,
+            WordCollection.user_id == user_id
+        ))
+        if not session.exec(statement).one():
+            raise HTTPException(status_code=404, detail=_ERR_COLLECTION_NOT_FOUND)
+
     @staticmethod
     async def update_collection(
         collection_id: uuid_pkg.UUID,
@@ -107,7 +151,8 @@ class CollectionService:
         session: Session = None
     ) -> WordCollection:
         """更新单词本"""
-        collection = await CollectionService.get_collection(collection_id, user_id, session)
+        # word_count 由数据库触发器维护，提交后 refresh 即可取得
+        collection = await CollectionService._get_collection_no_count(collection_id, user_id, session)
 
         if name is not None:
             collection.name = name
@@ -130,7 +175,7 @@ class CollectionService:
         session: Session
     ):
         """删除单词本（级联删除所有学习条目）"""
-        collection = await CollectionService.get_collection(collection_id, user_id, session)
+        collection = await CollectionService._get_collection_no_count(collection_id, user_id, session)
 
         session.delete(collection)
         session.commit()
@@ -141,32 +186,44 @@ class CollectionService:
         user_id: uuid_pkg.UUID,
         page: int,
         page_size: int,
-        session: Session
+        session: Session,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
-        """获取单词本中的所有单词（带学习进度）"""
+        """获取单词本中的所有单词（带学习进度，传入 cursor 时使用游标分页，忽略 page）"""
         # 验证单词本所有权
-        await CollectionService.get_collection(collection_id, user_id, session)
+        await CollectionService.assert_exists(collection_id, user_id, session)
 
-        # 计算偏移量
-        offset = (page - 1) * page_size
+        # 查询单词本中的单词：多对一关联用 joinedload 在同一查询中取出词库条目，窗口函数附带总数
+        statement = (
+            select(UserWordItem, func.count().over())
+            .options(joinedload(UserWordItem.word))
+            .where(UserWordItem.collection_id == collection_id)
+            .order_by(UserWordItem.created_at.desc(), UserWordItem.id.desc())
+            .limit(page_size)
+        )
 
-        # 查询单词本中的单词
-        statement = select(UserWordItem, WordBook).join(
-            WordBook, UserWordItem.word_id == WordBook.id
-        ).where(
-            UserWordItem.collection_id == collection_id
-        ).offset(offset).limit(page_size).order_by(UserWordItem.created_at.desc())
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+            statement = statement.where(
+                tuple_(UserWordItem.created_at, UserWordItem.id) < tuple_(cursor_created_at, cursor_id)
+            )
+        else:
+            statement = statement.offset((page - 1) * page_size)
 
         results = session.exec(statement).all()
 
-        # 统计总数
-        count_statement = select(func.count()).select_from(UserWordItem).where(
-            UserWordItem.collection_id == collection_id
-        )
-        total = session.exec(count_statement).one()
+        # 游标模式或空页时回退到单独统计总数
+        if results and not cursor:
+            total = results[0][1]
+        else:
+            count_statement = select(func.count()).select_from(UserWordItem).where(
+                UserWordItem.collection_id == collection_id
+            )
+            total = session.exec(count_statement).one()
 
         words = []
-        for item, word in results:
+        for item, _ in results:
+            word = item.word
             words.append({
                 "item_id": item.id,
                 "word_id": word.id,
@@ -180,9 +237,15 @@ class CollectionService:
                 "created_at": item.created_at
             })
 
+        next_cursor = None
+        if len(results) == page_size:
+            last_item = results[-1][0]
+            next_cursor = encode_cursor(last_item.created_at, last_item.id)
+
         return {
             "total": total,
             "words": words,
             "page": page,
-            "page_size": page_size
+            "page_size": page_size,
+            "next_cursor": next_cursor
         }
\ No newline at end of file
@@ -1,39 +1,44 @@
 from sqlmodel import Session, select, func
 from datetime import datetime, date
 from app.models import WordCollection, UserWordItem
+from typing import Optional, Tuple
 import uuid as uuid_pkg
 
+# (date, start-of-day datetime); recomputed only when the date changes
+_today_start_cache: Tuple[Optional[date], Optional[datetime]] = (None, None)
+
+
+def _today_start() -> datetime:
+    """Return midnight of the current local date, cached until the date rolls over"""
+    global _today_start_cache
+    today = date.today()
+    if _today_start_cache[0] != today:
+        _today_start_cache = (today, datetime.combine(today, datetime.min.time()))
+    return _today_start_cache[1]
+
+
 class DashboardService:
     @staticmethod
     async def get_stats(user_id: uuid_pkg.UUID, session: Session) -> dict:
-        # 1. Total Collections
-        total_collections = session.exec(
-            select(func.count()).select_from(WordCollection).where(WordCollection.user_id == user_id)
-        ).one()
-
-        # 2. Total Words (Count of UserWordItem)
-        # Use UserWordItem count for accuracy instead of relying on collection metadata
-        total_words = session.exec(
-            select(func.count()).select_from(UserWordItem).where(UserWordItem.user_id == user_id)
-        ).one()
-
-        # 3. To Review (Status = 2)
-        to_review = session.exec(
-            select(func.count()).select_from(UserWordItem).where(
-                UserWordItem.user_id == user_id,
-                UserWordItem.status == 2
-            )
-        ).one()
+        # Single round-trip: collection count as a scalar subquery,
+        # word counts as conditional aggregates over one scan of user_word_items
+        today_start = _today_start()
+        total_collections_subq = (
+            select(func.count())
+            .select_from(WordCollection)
+            .where(WordCollection.user_id == user_id)
+            .scalar_subquery()
+        )
+        statement = select(
+            total_collections_subq,
+            func.count(UserWordItem.id),
+            # To Review (Status = 2)
+            func.count(UserWordItem.id).filter(UserWordItem.status == 2),
+            # Today Learned: items where last_review_time is today
+            func.count(UserWordItem.id).filter(UserWordItem.last_review_time >= today_start)
+        ).where(UserWordItem.user_id == user_id)
 
-        # 4. Today Learned
-        # Count items where last_review_time is today
-        today_start = datetime.combine(date.today(), datetime.min.time())
-        today_learned = session.exec(
-            select(func.count()).select_from(UserWordItem).where(
-                UserWordItem.user_id == user_id,
-                UserWordItem.last_review_time >= today_start
-            )
-        ).one()
+        total_collections, total_words, to_review, today_learned = session.exec(statement).one()
 
         return {
             "total_words": total_words,
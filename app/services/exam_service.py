@@ -1,13 +1,53 @@
 """考试服务（支持后台生成、即时复习、状态流转）"""
+import asyncio
+
 from sqlmodel import Session, select, func, desc
 from app.models import UserWordItem, WordBook, User, WordCollection, Exam, ExamSpellingSection, ExamTranslationSection, Message
-from sqlalchemy import func
+from sqlalchemy import exists, func, insert, or_, update
+from app.schemas.exam import ExamInfo, SpellingQuestion, TranslationQuestion
 from app.services.llm_service import get_llm_service_for_user
 from app.services.message_service import MessageService
+from app.database import engine
+from app.utils.ids import uuid7
 from typing import List, Dict, Any, Optional
 import uuid as uuid_pkg
 import random
-from datetime import datetime
+import logging
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+
+def _as_uuid(value: Any) -> uuid_pkg.UUID:
+    """将前端传入的 ID（UUID 或字符串）转换为 UUID，已是 UUID 时直接返回"""
+    if isinstance(value, uuid_pkg.UUID):
+        return value
+    return uuid_pkg.UUID(str(value))
+
+
+def _word_in_active_exam(
+    user_id: uuid_pkg.UUID,
+    statuses: List[str],
+    mode: Optional[str] = None,
+    exclude_exam_id: Optional[uuid_pkg.UUID] = None
+):
+    """
+    构造关联子查询条件：UserWordItem 的单词已出现在该用户指定状态的考试中
+
+    配合 ~ 使用即为 NOT EXISTS，数据库可按 word_id 逐行探测索引，无需物化占用的单词列表
+    """
+    condition = exists().where(
+        ExamSpellingSection.word_id == UserWordItem.word_id,
+        Exam.id == ExamSpellingSection.exam_id,
+        Exam.user_id == user_id,
+        Exam.exam_status.in_(statuses)
+    )
+    if mode is not None:
+        condition = condition.where(Exam.mode == mode)
+    if exclude_exam_id is not None:
+        condition = condition.where(Exam.id != exclude_exam_id)
+    return condition
+
 
 class ExamService:
     @staticmethod
@@ -40,53 +80,30 @@ class ExamService:
         # 特殊逻辑：完全复习 (Complete)
         if mode == "complete":
             # 1. 锁定机制：如果有未完成的完全复习，不允许生成新的
-            has_active_complete = session.exec(select(Exam).where(
+            has_active_complete = exists().where(
                 Exam.user_id == user_id,
                 Exam.mode == "complete",
                 Exam.exam_status.in_(["pending", "generated", "grading"])
-            )).first()
-
-            if has_active_complete:
-                return 0
-
+            )
             # 2. 前置条件：单词本中所有单词状态必须 >= 3 (已掌握/已完成)
-            unmastered_count = session.exec(
-                select(func.count()).select_from(UserWordItem).where(
-                    UserWordItem.user_id == user_id,
-                    UserWordItem.collection_id == collection_id,
-                    UserWordItem.status < 3
-                )
-            ).one()
-
-            if unmastered_count > 0:
-                return 0
-
-        # 1. 查找当前用户所有未完成的同类型考试
-        active_exams = session.exec(
-            select(Exam.id).where(
-                Exam.user_id == user_id,
-                Exam.mode == mode, # 仅排除同模式的考试
-                Exam.exam_status.in_(["generated", "grading", "pending"])
+            has_unmastered = exists().where(
+                UserWordItem.user_id == user_id,
+                UserWordItem.collection_id == collection_id,
+                UserWordItem.status < 3
             )
-        ).all()
 
-        active_word_ids = []
-        if active_exams:
-             active_word_ids = session.exec(
-                select(ExamSpellingSection.word_id).where(
-                    ExamSpellingSection.exam_id.in_(active_exams)
-                )
-            ).all()
+            # 两个条件在一次查询中判断，EXISTS 找到第一行即停止
+            if session.exec(select(or_(has_active_complete, has_unmastered))).one():
+                return 0
 
-        # 2. 构建查询
+        # 1. 统计可用单词，排除当前用户所有未完成的同类型考试已占用的单词（NOT EXISTS）
         query = select(func.count()).select_from(UserWordItem).where(
             UserWordItem.user_id == user_id,
-            UserWordItem.collection_id == collection_id
+            UserWordItem.collection_id == collection_id,
+            # 仅排除同模式的考试
+            ~_word_in_active_exam(user_id, ["generated", "grading", "pending"], mode=mode)
         )
 
-        if active_word_ids:
-            query = query.where(UserWordItem.word_id.notin_(active_word_ids))
-
         if mode == "complete":
             query = query.where(UserWordItem.status == 3)
         elif mode == "random":
@@ -98,6 +115,23 @@ class ExamService:
 
         return session.exec(query).one()
 
+    @staticmethod
+    async def process_exam_generation_task(
+        exam_id: uuid_pkg.UUID,
+        mode: str,
+        target_count: int,
+        specific_item_ids: Optional[List[uuid_pkg.UUID]] = None
+    ):
+        """后台任务入口：使用独立的数据库会话生成试卷（请求范围的 session 在响应后已关闭）"""
+        with Session(engine) as session:
+            await ExamService.process_exam_generation(
+                exam_id=exam_id,
+                mode=mode,
+                target_count=target_count,
+                session=session,
+                specific_item_ids=specific_item_ids
+            )
+
     @staticmethod
     async def process_exam_generation(
         exam_id: uuid_pkg.UUID,
@@ -107,15 +141,19 @@ class ExamService:
         specific_item_ids: Optional[List[uuid_pkg.UUID]] = None
     ):
         """后台任务：执行考试生成逻辑"""
+        exam = None
         try:
             exam = session.get(Exam, exam_id)
             if not exam:
                 return
 
-            user = session.get(User, exam.user_id)
-
-            # 1. 根据模式筛选单词
-            query = select(UserWordItem, WordBook).join(
+            # 1. 根据模式筛选单词（只取生成试卷需要的列，释义直接从 JSONB 中取出）
+            query = select(
+                UserWordItem.id,
+                WordBook.id,
+                WordBook.word,
+                WordBook.content["chinese"].astext
+            ).join(
                 WordBook, UserWordItem.word_id == WordBook.id
             ).where(
                 UserWordItem.collection_id == exam.collection_id,
@@ -130,88 +168,66 @@ class ExamService:
                 # --- 排除已在其他未完成考试（generated, grading）中使用的单词 ---
                 # 仅针对 'immediate' 模式执行严格去重
                 if mode == 'immediate':
-                    # 1. 查找当前用户所有未完成的考试
-                    active_exams = session.exec(
-                        select(Exam.id).where(
-                            Exam.user_id == exam.user_id,
-                            # Exam.mode == mode, # 移除模式限制，即时复习应排除所有占用
-                            Exam.exam_status.in_(["generated", "grading"]),
-                            Exam.id != exam.id  # 排除自己
-                        )
-                    ).all()
-
-                    if active_exams:
-                        # 2. 查找这些考试已经包含的 word_id (从 ExamSpellingSection 表查)
-                        active_word_ids = session.exec(
-                            select(ExamSpellingSection.word_id).where(
-                                ExamSpellingSection.exam_id.in_(active_exams)
-                            )
-                        ).all()
-
-                        if active_word_ids:
-                            # 3. 在本次查询中排除这些 word_id
-                            query = query.where(UserWordItem.word_id.notin_(active_word_ids))
+                    # 排除当前用户所有未完成考试（排除自己）已包含的单词；不限模式，即时复习应排除所有占用
+                    query = query.where(
+                        ~_word_in_active_exam(exam.user_id, ["generated", "grading"], exclude_exam_id=exam.id)
+                    )
                 # -----------------------------------------------------------
 
-                # 模式逻辑
+                # 模式逻辑（抽样和截取在数据库中完成，只取回需要的行）
                 if mode == "immediate":
                     # 即时复习：Status=2, 按最后复习时间倒序
                     query = query.where(UserWordItem.status == 2).order_by(desc(UserWordItem.last_review_time))
                 elif mode == "random":
                     # 随机复习：Status=2 (复习中) 或 Status=4 (已完成)
-                    query = query.where(UserWordItem.status.in_([2, 4]))
+                    query = query.where(UserWordItem.status.in_([2, 4])).order_by(func.random())
                 elif mode == "complete":
-                    # 完全复习：Status=3
-                    query = query.where(UserWordItem.status == 3)
+                    # 完全复习：Status=3（未指定 ID 时的 fallback）
+                    query = query.where(UserWordItem.status == 3).order_by(func.random())
                 else:
                     # 默认 fallback
                     query = query.where(UserWordItem.status == 2)
 
-            all_items = session.exec(query).all()
+                query = query.limit(target_count)
 
-            # 选择单词
-            if specific_item_ids:
-                 # 如果指定了ID，则使用查询到的所有结果
-                selected_items = all_items
-            elif mode == "random":
-                selected_items = random.sample(all_items, min(target_count, len(all_items)))
-            elif mode == "complete":
-                 # Fallback if no specific ids provided for complete
-                selected_items = random.sample(all_items, min(target_count, len(all_items)))
-            else:
-                # immediate 已经排序过，取前N个
-                selected_items = all_items[:target_count]
+            # 选择单词（指定了 ID 时使用查询到的所有结果）
+            selected_items = session.exec(query).all()
 
             if not selected_items:
                 exam.exam_status = "failed"
                 exam.generation_error = "没有符合条件的单词可供复习（可能单词已在其他未完成的考试中）"
-                session.add(exam)
-                session.commit()
-                # 发送失败消息
-                MessageService.create_message(session, user.id, "考试生成失败", "没有找到符合条件的单词，或者所有符合条件的单词都已在其他未完成的考试中。")
+                # 发送失败消息（与状态更新同一事务提交）
+                MessageService.create_message(session, exam.user_id, "考试生成失败", "没有找到符合条件的单词，或者所有符合条件的单词都已在其他未完成的考试中。", commit=False)
+                await asyncio.to_thread(session.commit)
                 return
 
             # 2. 生成拼写部分 (保存到数据库)
             exam_word_ids = [] # 记录本次考试涉及的所有 Word ID (UUID)
             words_text_list = [] # 单词文本列表，供LLM造句
 
-            for item, word in selected_items:
-                spelling_section = ExamSpellingSection(
-                    exam_id=exam.id,
-                    word_id=word.id,
-                    item_id=item.id, # Save item_id
-                    chinese_meaning=word.content.get("chinese", "未知含义"),
-                    english_answer=word.word
-                )
-                session.add(spelling_section)
+            spelling_rows = []
+            for item_id, word_id, word_text, chinese in selected_items:
+                spelling_rows.append({
+                    "id": uuid7(),
+                    "exam_id": exam.id,
+                    "word_id": word_id,
+                    "item_id": item_id, # Save item_id
+                    "chinese_meaning": chinese if chinese is not None else "未知含义",
+                    "english_answer": word_text
+                })
+
+                exam_word_ids.append(word_id)
+                words_text_list.append(word_text)
 
-                exam_word_ids.append(word.id)
-                words_text_list.append(word.word)
+            # 批量写入（executemany），不逐行构造 ORM 对象
+            session.exec(insert(ExamSpellingSection), params=spelling_rows)
 
             # 3. 生成翻译部分 (调用LLM)
             # 随机选出几个词（不超过10个）用于造句
             sentence_words_candidates = random.sample(words_text_list, min(10, len(words_text_list)))
 
+            # 用户只在这里用于读取 LLM 配置，通知直接使用 exam.user_id
+            user = session.get(User, exam.user_id)
             llm_service = get_llm_service_for_user(user)
             # 生成 3-5 个句子
             generated_sentences = await llm_service.generate_exam_sentences(
@@ -220,48 +236,62 @@ class ExamService:
                 sentence_count=min(5, max(3, len(sentence_words_candidates) // 2))
             )
 
+            # 单词文本(小写) -> 学习条目 ID，重名时保留第一个匹配，与逐个扫描的结果一致
+            word_to_item_id = {}
+            for item_id, _, word_text, _ in selected_items:
+                word_to_item_id.setdefault(word_text.lower(), item_id)
+
+            translation_rows = []
             for i, sent_data in enumerate(generated_sentences):
                 # 找出句子涉及的单词ID
-                involved_word_ids = []
                 used_words = sent_data.get("words_used", [])
-                for w_text in used_words:
-                    # 简单匹配找到对应的 UUID (可能有重名单词，这里简单处理取当前选中的)
-                    for item, word in selected_items:
-                        if word.word.lower() == w_text.lower():
-                            involved_word_ids.append(item.id)
-                            break
-
-                translation_section = ExamTranslationSection(
-                    exam_id=exam.id,
-                    sentence_id=f"sent_{exam.id}_{i}",
-                    chinese_sentence=sent_data.get("chinese", ""),
-                    words_involved=involved_word_ids
+                involved_word_ids = [
+                    word_to_item_id[w_text.lower()]
+                    for w_text in used_words
+                    if w_text.lower() in word_to_item_id
+                ]
+
+                translation_rows.append({
+                    "id": uuid7(),
+                    "exam_id": exam.id,
+                    "sentence_id": f"sent_{exam.id}_{i}",
+                    "chinese_sentence": sent_data.get("chinese", ""),
+                    "words_involved": involved_word_ids
+                })
+
+            if translation_rows:
+                session.exec(insert(ExamTranslationSection), params=translation_rows)
+
+            # 4. 更新考试状态（单条 UPDATE，与上面的批量插入同一事务提交）
+            session.exec(
+                update(Exam)
+                .where(Exam.id == exam.id)
+                .values(
+                    exam_status="generated",
+                    spelling_words_count=len(selected_items),
+                    translation_sentences_count=len(generated_sentences)
                 )
-                session.add(translation_section)
-
-            # 4. 更新考试状态
-            exam.exam_status = "generated"
-            exam.spelling_words_count = len(selected_items)
-            exam.translation_sentences_count = len(generated_sentences)
-            session.add(exam)
-            session.commit()
+            )
 
-            # 5. 发送通知
+            # 5. 发送通知（与试卷内容、考试状态同一事务提交）
             MessageService.create_message(
                 session,
-                user.id,
+                exam.user_id,
                 "复习试卷生成完成",
-                f"您的复习试卷已生成！包含 {len(selected_items)} 个单词和 {len(generated_sentences)} 个句子。请前往复习列表查看。"
+                f"您的复习试卷已生成！包含 {len(selected_items)} 个单词和 {len(generated_sentences)} 个句子。请前往复习列表查看。",
+                commit=False
             )
+            await asyncio.to_thread(session.commit)
 
         except Exception as e:
-            print(f"Error generating exam: {e}")
+            logger.exception("Exam generation failed for exam %s", exam_id)
+            # 先回滚：数据库错误会让事务处于失败状态，且需丢弃已写入的部分试卷内容
+            await asyncio.to_thread(session.rollback)
             if exam:
                 exam.exam_status = "failed"
                 exam.generation_error = str(e)
-                session.add(exam)
-                session.commit()
-                MessageService.create_message(session, exam.user_id, "考试生成失败", f"系统错误: {str(e)}")
+                MessageService.create_message(session, exam.user_id, "考试生成失败", f"系统错误: {str(e)}", commit=False)
+                await asyncio.to_thread(session.commit)
 
     @staticmethod
     def prepare_complete_review_exams(
@@ -296,13 +326,17 @@ class ExamService:
         random.shuffle(items_list)
 
         # 4. 分割并创建试卷
-        # 使用取模方式分配，确保均匀
-        chunks = [[] for _ in range(K)]
-        for i, item in enumerate(items_list):
-            chunks[i % K].append(item)
+        # 已随机打乱，按连续切片分配即可保证均匀：前 N % K 份各多一个
+        base_size, remainder = divmod(N, K)
+        chunks = []
+        offset = 0
+        for i in range(K):
+            size = base_size + (1 if i < remainder else 0)
+            chunks.append(items_list[offset:offset + size])
+            offset += size
 
         result = []
-        for i, chunk in enumerate(chunks):
+        for chunk in chunks:
             if not chunk:
                 continue
 
@@ -317,13 +351,18 @@ class ExamService:
                 spelling_words_count=len(chunk),
                 translation_sentences_count=0
             )
-            session.add(exam)
-            session.commit()
-            session.refresh(exam)
-
             item_ids = [item.id for item in chunk]
             result.append((exam, item_ids))
 
+        # 所有分卷一次性写入；调用方只读取客户端生成的字段（id、total_words），
+        # 写入后从会话中移除，提交时不会过期，避免逐个 refresh
+        exams = [exam for exam, _ in result]
+        session.add_all(exams)
+        session.flush()
+        for exam in exams:
+            session.expunge(exam)
+        session.commit()
+
         return result
 
     @staticmethod
@@ -337,39 +376,41 @@ class ExamService:
         """获取用户考试列表"""
         offset = (page - 1) * size
 
-        # Base query
-        query = select(Exam).where(Exam.user_id == user_id)
+        # Base query（外连接带出单词本名称，窗口函数随本页数据一并返回筛选后的总数）
+        query = select(Exam, WordCollection.name, func.count().over()).outerjoin(
+            WordCollection, WordCollection.id == Exam.collection_id
+        ).where(Exam.user_id == user_id)
         if mode:
             query = query.where(Exam.mode == mode)
 
         statement = query.order_by(desc(Exam.created_at)).offset(offset).limit(size)
-        exams = session.exec(statement).all()
-
-        # Count total
-        count_query = select(func.count()).select_from(Exam).where(Exam.user_id == user_id)
-        if mode:
-            count_query = count_query.where(Exam.mode == mode)
-
-        total = session.exec(count_query).one()
+        rows = session.exec(statement).all()
+
+        if rows:
+            total = rows[0][2]
+        elif page > 1:
+            # 页码超出范围时本页为空，单独统计总数
+            count_query = select(func.count()).select_from(Exam).where(Exam.user_id == user_id)
+            if mode:
+                count_query = count_query.where(Exam.mode == mode)
+            total = session.exec(count_query).one()
+        else:
+            total = 0
 
         exam_infos = []
-        for ex in exams:
-            # 获取 collection name
-            coll = session.get(WordCollection, ex.collection_id)
-            coll_name = coll.name if coll else "未知单词本"
-
-            exam_infos.append({
-                "exam_id": ex.id,
-                "user_id": ex.user_id,
-                "collection_name": coll_name,
-                "total_words": ex.total_words,
-                "spelling_words_count": ex.spelling_words_count,
-                "translation_sentences_count": ex.translation_sentences_count,
-                "exam_status": ex.exam_status,
-                "mode": ex.mode,
-                "created_at": ex.created_at,
-                "completed_at": ex.completed_at
-            })
+        for ex, coll_name, _ in rows:
+            exam_infos.append(ExamInfo.model_construct(
+                exam_id=ex.id,
+                user_id=ex.user_id,
+                collection_name=coll_name or "未知单词本",
+                total_words=ex.total_words,
+                spelling_words_count=ex.spelling_words_count,
+                translation_sentences_count=ex.translation_sentences_count,
+                exam_status=ex.exam_status,
+                mode=ex.mode,
+                created_at=ex.created_at,
+                completed_at=ex.completed_at
+            ))
 
         return {
             "exams": exam_infos,
@@ -384,41 +425,47 @@ class ExamService:
     @staticmethod
     def get_exam_detail(exam_id: uuid_pkg.UUID, session: Session) -> Optional[Dict[str, Any]]:
         """获取考试详情（包含题目预览）"""
-        exam = session.get(Exam, exam_id)
-        if not exam:
+        # 考试与单词本名称一次查询取出
+        row = session.exec(
+            select(Exam, WordCollection.name).outerjoin(
+                WordCollection, WordCollection.id == Exam.collection_id
+            ).where(Exam.id == exam_id)
+        ).first()
+        if not row:
             return None
 
-        coll = session.get(WordCollection, exam.collection_id)
+        exam, coll_name = row
 
         # 获取部分题目作为预览/加载内容
         spelling_sections = session.exec(select(ExamSpellingSection).where(ExamSpellingSection.exam_id == exam_id)).all()
         translation_sections = session.exec(select(ExamTranslationSection).where(ExamTranslationSection.exam_id == exam_id)).all()
 
         # 格式化拼写部分
+        # 数据均来自数据库，使用 model_construct 跳过重复校验
         spelling_list = []
         for s in spelling_sections:
-            spelling_list.append({
-                "word_id": s.word_id,
-                "item_id": s.item_id, # Return item_id to frontend
-                "chinese": s.chinese_meaning,
-                "english_answer": s.english_answer # 前端需要答案进行本地判断?
+            spelling_list.append(SpellingQuestion.model_construct(
+                word_id=s.word_id,
+                item_id=s.item_id, # Return item_id to frontend
+                chinese=s.chinese_meaning,
+                english_answer=s.english_answer # 前端需要答案进行本地判断?
                 # 需求设计: "默写与翻译两个部分，默写部分的单词的英文答案使用匹配的方法（由前端完成）" -> 是的，需要返回答案
-            })
+            ))
 
         # 格式化翻译部分
         translation_list = []
         for t in translation_sections:
-            translation_list.append({
-                "sentence_id": t.sentence_id,
-                "chinese": t.chinese_sentence,
-                "words_involved": t.words_involved # Returns UUID list
-            })
+            translation_list.append(TranslationQuestion.model_construct(
+                sentence_id=t.sentence_id,
+                chinese=t.chinese_sentence,
+                words_involved=t.words_involved # Returns UUID list
+            ))
 
         return {
             "exam_id": exam.id,
             "user_id": exam.user_id,
             "collection_id": exam.collection_id,
-            "collection_name": coll.name if coll else "未知",
+            "collection_name": coll_name or "未知",
             "exam_status": exam.exam_status,
             "total_words": exam.total_words,
             "spelling_words_count": exam.spelling_words_count,
@@ -436,9 +483,25 @@ class ExamService:
         exam = session.get(Exam, exam_id)
         if exam:
             exam.exam_status = "grading"
-            session.add(exam)
             session.commit()
 
+    @staticmethod
+    async def submit_exam_task(
+        exam_id: uuid_pkg.UUID,
+        user_id: uuid_pkg.UUID,
+        wrong_word_ids: List[uuid_pkg.UUID],
+        sentences_submission: List[Dict]
+    ):
+        """后台任务入口：使用独立的数据库会话阅卷"""
+        with Session(engine) as session:
+            await ExamService.submit_exam(
+                exam_id=exam_id,
+                user_id=user_id,
+                wrong_word_ids=wrong_word_ids,
+                sentences_submission=sentences_submission,
+                session=session
+            )
+
     @staticmethod
     async def submit_exam(
         exam_id: uuid_pkg.UUID,
@@ -461,99 +524,98 @@ class ExamService:
         llm_service = get_llm_service_for_user(user)
         translation_results = []
 
-        # 批量获取所有涉及单词的文本，避免 N+1 查询
-        all_involved_item_ids = set()
+        # 每个句子涉及的条目 ID 只解析一次（前端可能传 UUID 或字符串，忽略无效值）
+        # 同一单词可能出现在多个句子中，按原始值缓存解析结果，无效值缓存为 None
+        uuid_cache: Dict[str, Optional[uuid_pkg.UUID]] = {}
+        involved_ids_per_sentence = []
         for sent_sub in sentences_submission:
-            words_involved = sent_sub.get("words_involved", [])
-            for w_id in words_involved:
-                try:
-                    all_involved_item_ids.add(uuid_pkg.UUID(str(w_id)))
-                except (ValueError, TypeError):
-                    pass
+            parsed_ids = []
+            for w_id in sent_sub.get("words_involved", []):
+                if isinstance(w_id, uuid_pkg.UUID):
+                    parsed_ids.append(w_id)
+                    continue
+                key = str(w_id)
+                if key not in uuid_cache:
+                    try:
+                        uuid_cache[key] = _as_uuid(key)
+                    except ValueError:
+                        uuid_cache[key] = None
+                w_uuid = uuid_cache[key]
+                if w_uuid is not None:
+                    parsed_ids.append(w_uuid)
+            involved_ids_per_sentence.append(parsed_ids)
+
+        # 批量获取所有涉及单词的文本，避免 N+1 查询
+        all_involved_item_ids = {w_uuid for parsed_ids in involved_ids_per_sentence for w_uuid in parsed_ids}
 
         # 建立 UserWordItem ID -> Word Text 的映射
         item_text_map = {}
         if all_involved_item_ids:
             stmt = select(UserWordItem.id, WordBook.word).join(
                 WordBook, UserWordItem.word_id == WordBook.id
-            ).where(UserWordItem.id.in_(all_involved_item_ids))
+            ).where(
+                UserWordItem.id.in_(all_involved_item_ids),
+                UserWordItem.user_id == user_id
+            )
             results = session.exec(stmt).all()
             item_text_map = {item_id: word_text for item_id, word_text in results}
 
-        for sent_sub in sentences_submission:
-            sentence_id = sent_sub.get("sentence_id")
-            chinese = sent_sub.get("chinese")
-            english_user = sent_sub.get("english")
-            words_involved = sent_sub.get("words_involved", []) # This might be UUIDs or strings depending on frontend
-
-            # 获取关联单词的英文原词
-            required_words_text = []
-            for w_id in words_involved:
-                try:
-                    w_uuid = uuid_pkg.UUID(str(w_id))
-                    if w_uuid in item_text_map:
-                        required_words_text.append(item_text_map[w_uuid])
-                except (ValueError, TypeError):
-                    pass
-
-            # 使用 LLM 评判
-            grading_result = await llm_service.grade_translation(
-                source_text=chinese,
-                user_translation=english_user,
-                required_words=required_words_text
-            )
+        # 按句子顺序一次性整理出关联单词的英文原词（按位置对应，sentence_id 缺失或重复时也不会错配）
+        required_words_per_sentence = [
+            [item_text_map[w_uuid] for w_uuid in involved_ids if w_uuid in item_text_map]
+            for involved_ids in involved_ids_per_sentence
+        ]
+
+        # 使用 LLM 批量并发评判所有句子（结果按位置对应，单句失败不影响其他句子）
+        grading_results = await llm_service.grade_translations_batch([
+            {
+                "source_text": sent_sub.get("chinese"),
+                "user_translation": sent_sub.get("english"),
+                "required_words": required_words
+            }
+            for sent_sub, required_words in zip(sentences_submission, required_words_per_sentence)
+        ])
+
+        for sent_sub, involved_ids, grading_result in zip(
+            sentences_submission, involved_ids_per_sentence, grading_results
+        ):
             is_correct = grading_result.get("correct", False)
 
             translation_results.append({
-                "sentence_id": sentence_id,
-                "chinese": chinese,
-                "your_answer": english_user,
+                "sentence_id": sent_sub.get("sentence_id"),
+                "chinese": sent_sub.get("chinese"),
+                "your_answer": sent_sub.get("english"),
                 "is_correct": is_correct,
                 "feedback": grading_result.get("feedback", "")
             })
 
             if not is_correct:
                 # 翻译错误，涉及单词 status -> 0
-                for w_id in words_involved:
-                    # w_id might be string format UUID
-                    try:
-                        w_uuid = uuid_pkg.UUID(str(w_id))
-                        failed_word_ids_set.add(w_uuid)
-                    except:
-                        pass
+                failed_word_ids_set.update(involved_ids)
 
         # 3. 更新数据库状态
-        # 获取考试所有涉及单词
-        all_spelling = session.exec(select(ExamSpellingSection).where(ExamSpellingSection.exam_id == exam_id)).all()
-        # 使用 item_id 进行集合运算
-        all_exam_item_ids = {s.item_id for s in all_spelling}
+        # 获取考试所有涉及单词（只取 item_id 列，用于集合运算）
+        all_exam_item_ids = set(session.exec(
+            select(ExamSpellingSection.item_id).where(ExamSpellingSection.exam_id == exam_id)
+        ).all())
 
         # 正确单词 = 所有单词 - 失败单词
         passed_item_ids = all_exam_item_ids - failed_word_ids_set
 
-        # 更新失败单词 -> 0
-        from app.services.progress_service import ProgressService
-        for item_id in failed_word_ids_set:
-            uw_item = session.get(UserWordItem, item_id)
-            # 确保条目存在且属于当前用户（安全检查）
-            if uw_item and uw_item.user_id == user_id:
-                ProgressService.reset_to_new(uw_item, session)
+        # 同一次阅卷只读取一次时钟：复习时间（UTC）与考试完成时间使用同一时刻
+        now = datetime.utcnow()
 
-        # 5. 更新通过单词 -> +1
+        # 失败单词 -> 0、通过单词 -> +1，各一条 UPDATE（仅限当前用户，安全检查；与考试记录一起在最后统一提交）
         from app.services.progress_service import ProgressService
-        for item_id in passed_item_ids:
-            uw_item = session.get(UserWordItem, item_id)
-            if uw_item and uw_item.user_id == user_id:
-                ProgressService.update_exam_success(uw_item, exam.mode, session)
+        ProgressService.bulk_reset_to_new(failed_word_ids_set, user_id, session)
+        ProgressService.bulk_update_exam_success(passed_item_ids, user_id, exam.mode, session, now=now)
 
         # 4. 更新考试记录
         exam.exam_status = "completed"
-        exam.completed_at = datetime.now()
-        session.add(exam)
+        # completed_at 与考试其他时间字段一致使用本地时间，由同一时刻换算
+        exam.completed_at = now.replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
 
-        session.commit()
-
-        # 5. 发送站内信结果
+        # 5. 发送站内信结果（与进度、考试记录同一事务提交）
         msg_content = (
             f"考试已完成！\n"
             f"总单词数: {len(all_exam_item_ids)}\n"
@@ -564,7 +626,9 @@ class ExamService:
         for res in translation_results:
             msg_content += f"- {res['chinese']}\n  您的翻译: {res['your_answer']}\n  判定: {'✅ 正确' if res['is_correct'] else '❌ 错误'}\n"
 
-        MessageService.create_message(session, user_id, "考试结果通知", msg_content)
+        MessageService.create_message(session, user_id, "考试结果通知", msg_content, commit=False)
+
+        await asyncio.to_thread(session.commit)
 
         return {"success": True, "message": "考试已提交，结果已发送至站内信"}
 
@@ -584,15 +648,7 @@ class ExamService:
         if exam.exam_status not in ["completed", "failed"]:
             raise ValueError("仅能删除已完成或失败的考试记录")
 
-        # 2. 删除关联的题目数据 (如果数据库没设置级联删除，这里手动删除)
-        # 实际上 SQLModel 的 delete() 方法可能不直接支持 exec().delete()，通常是用 session.delete(obj)
-        # 为了稳妥，先查再删，或者使用 delete 语句
-        # SQLModel 0.0.16+ 支持 session.exec(delete(...))
-        from sqlmodel import delete
-        session.exec(delete(ExamSpellingSection).where(ExamSpellingSection.exam_id == exam_id))
-        session.exec(delete(ExamTranslationSection).where(ExamTranslationSection.exam_id == exam_id))
-
-        # 3. 删除考试记录
+        # 2. 删除考试记录（关联的题目数据由外键 ON DELETE CASCADE 在数据库中一并删除）
         session.delete(exam)
         session.commit()
         return True
@@ -252,24 +252,63 @@ class LLMService:
                 "feedback": "评判系统暂时不可用，请稍后再试"
             }
 
+    async def grade_translations_batch(
+        self,
+        items: List[Dict[str, Any]],
+        max_concurrency: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Grade several translations concurrently.
 
-def get_llm_service_for_user(user: User) -> LLMService:
+        Each item holds `source_text`, `user_translation` and `required_words`.
+        Results are aligned with `items` by index; a failed call falls back to
+        an incorrect result without affecting the others.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _grade(item: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.grade_translation(
+                    source_text=item.get("source_text"),
+                    user_translation=item.get("user_translation"),
+                    required_words=item.get("required_words", [])
+                )
+
+        return await asyncio.gather(*(_grade(item) for item in items))
+
+
+_default_llm_service: Optional[LLMService] = None
+
+
+def _get_default_llm_service() -> LLMService:
     """
-    根据用户配置获取 LLM 服务实例
-    - 如果用户选择使用默认配置，使用系统配置
-    - 否则使用用户自定义配置
+    系统默认配置的 LLM 服务实例（懒加载，进程内共享同一个客户端连接池）
+
+    只缓存默认配置；用户自定义的 API Key 不在进程内长期保存，按需创建实例
     """
-    if user.use_default_llm:
-        # 使用系统默认配置（从 .env）
-        return LLMService(
+    global _default_llm_service
+    if _default_llm_service is None:
+        _default_llm_service = LLMService(
             api_key=settings.DEFAULT_LLM_API_KEY,
             base_url=settings.DEFAULT_LLM_BASE_URL,
             model=settings.DEFAULT_LLM_MODEL
         )
+    return _default_llm_service
+
+
+def get_llm_service_for_user(user: User) -> LLMService:
+    """
+    根据用户配置获取 LLM 服务实例
+    - 如果用户选择使用默认配置，使用系统配置
+    - 否则使用用户自定义配置
+    """
+    if user.use_default_llm or not (user.llm_api_key or user.llm_base_url or user.llm_model):
+        # 使用系统默认配置（从 .env），未填写任何自定义项时等同于默认配置
+        return _get_default_llm_service()
     else:
         # 使用用户自定义配置
         return LLMService(
             api_key=user.llm_api_key or settings.DEFAULT_LLM_API_KEY,
             base_url=user.llm_base_url or settings.DEFAULT_LLM_BASE_URL,
             model=user.llm_model or settings.DEFAULT_LLM_MODEL
-        )
\ No newline at end of file
+        )
@@ -4,9 +4,17 @@ import uuid
 
 class MessageService:
     @staticmethod
-    def create_message(session: Session, user_id: uuid.UUID, title: str, content: str) -> Message:
+    def create_message(
+        session: Session,
+        user_id: uuid.UUID,
+        title: str,
+        content: str,
+        commit: bool = True
+    ) -> Message:
         """
         创建一个新消息（供内部服务调用）
+
+        commit=False 时只加入会话，由调用方与其他改动在同一事务中提交
         """
         message = Message(
             user_id=user_id,
@@ -14,6 +22,7 @@ class MessageService:
             content=content
         )
         session.add(message)
-        session.commit()
-        session.refresh(message)
+        if commit:
+            session.commit()
+            session.refresh(message)
         return message
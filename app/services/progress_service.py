@@ -1,6 +1,9 @@
 from datetime import datetime
+from typing import Collection, Optional
+from sqlalchemy import case, update
 from sqlmodel import Session
 from app.models import UserWordItem
+import uuid as uuid_pkg
 
 class ProgressService:
     """
@@ -14,8 +17,11 @@ class ProgressService:
     """
 
     @staticmethod
-    def reset_to_new(item: UserWordItem, session: Session, is_skip: bool = False):
-        """Reset word status to 0 (New) due to failure or skip."""
+    def reset_to_new(item: UserWordItem, session: Session, is_skip: bool = False, commit: bool = True):
+        """
+        Reset word status to 0 (New) due to failure or skip.
+        Pass commit=False when updating many items in one transaction; the caller commits.
+        """
         if is_skip:
             item.study_count += 1
             # Skip counts as a fail for status reset purposes but we track it
@@ -26,7 +32,8 @@ class ProgressService:
             item.status = 0
 
         session.add(item)
-        session.commit()
+        if commit:
+            session.commit()
 
     @staticmethod
     def update_study_progress(item: UserWordItem, is_correct: bool, session: Session) -> str:
@@ -75,12 +82,20 @@ class ProgressService:
         return status_msg
 
     @staticmethod
-    def update_exam_success(item: UserWordItem, mode: str, session: Session):
+    def update_exam_success(
+        item: UserWordItem,
+        mode: str,
+        session: Session,
+        commit: bool = True,
+        now: Optional[datetime] = None
+    ):
         """
         Handle progress update for Exam success.
+        Pass commit=False when updating many items in one transaction; the caller commits.
+        Pass now to share one UTC timestamp across a batch of items.
         """
         item.review_count += 1
-        item.last_review_time = datetime.utcnow()
+        item.last_review_time = now or datetime.utcnow()
 
         if mode in ['immediate', 'random']:
             # Immediate/Random: Status 2 -> 3
@@ -92,4 +107,62 @@ class ProgressService:
                 item.status = 4
 
         session.add(item)
-        session.commit()
+        if commit:
+            session.commit()
+
+    @staticmethod
+    def bulk_reset_to_new(
+        item_ids: Collection[uuid_pkg.UUID],
+        user_id: uuid_pkg.UUID,
+        session: Session
+    ):
+        """
+        Set-based equivalent of reset_to_new (without skip) for many items owned by user_id.
+        Issues a single UPDATE; the caller commits.
+        """
+        if not item_ids:
+            return
+
+        session.exec(
+            update(UserWordItem)
+            .where(UserWordItem.id.in_(item_ids), UserWordItem.user_id == user_id)
+            .values(
+                fail_count=UserWordItem.fail_count + 1,
+                match_count=0,
+                status=0
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def bulk_update_exam_success(
+        item_ids: Collection[uuid_pkg.UUID],
+        user_id: uuid_pkg.UUID,
+        mode: str,
+        session: Session,
+        now: Optional[datetime] = None
+    ):
+        """
+        Set-based equivalent of update_exam_success for many items owned by user_id.
+        Issues a single UPDATE; the caller commits.
+        """
+        if not item_ids:
+            return
+
+        values = {
+            "review_count": UserWordItem.review_count + 1,
+            "last_review_time": now or datetime.utcnow(),
+        }
+        if mode in ['immediate', 'random']:
+            # Immediate/Random: Status 2 -> 3
+            values["status"] = case((UserWordItem.status == 2, 3), else_=UserWordItem.status)
+        elif mode == 'complete':
+            # Complete: Status 3 -> 4
+            values["status"] = case((UserWordItem.status == 3, 4), else_=UserWordItem.status)
+
+        session.exec(
+            update(UserWordItem)
+            .where(UserWordItem.id.in_(item_ids), UserWordItem.user_id == user_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
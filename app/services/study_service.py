@@ -5,7 +5,7 @@ from app.schemas.study import StudyMode
 from typing import List, Dict, Any
 import uuid as uuid_pkg
 from datetime import datetime
-import random
+from app.utils.sampling import reservoir_sample
 
 
 class StudyService:
@@ -41,7 +41,6 @@ class StudyService:
                 UserWordItem.user_id == user_id,
                 UserWordItem.status == 0
             )
-            new_words_results = session.exec(new_words_statement).all()
 
             # 待检验单词：status=1
             pending_check_statement = select(UserWordItem, WordBook).join(
@@ -53,8 +52,8 @@ class StudyService:
             )
             pending_check_results = session.exec(pending_check_statement).all()
 
-            # 随机抽取新词
-            new_words_sample = random.sample(new_words_results, min(20, len(new_words_results)))
+            # 随机抽取新词（流式读取结果，只在内存中保留抽中的行）
+            new_words_sample = reservoir_sample(session.exec(new_words_statement.execution_options(yield_per=512)), 20)
 
             # 使用 helper method 混合新词和待检验词
             words = StudyService._mix_new_and_pending_words(new_words_sample, pending_check_results)
@@ -68,8 +67,7 @@ class StudyService:
                 UserWordItem.user_id == user_id,
                 UserWordItem.status == 2
             )
-            results = session.exec(statement).all()
-            results = random.sample(results, min(50, len(results)))
+            results = reservoir_sample(session.exec(statement.execution_options(yield_per=512)), 50)
 
             words = []
             for item, word in results:
@@ -94,8 +92,7 @@ class StudyService:
                 UserWordItem.user_id == user_id,
                 UserWordItem.status == 3
             )
-            results = session.exec(statement).all()
-            results = random.sample(results, min(20, len(results)))
+            results = reservoir_sample(session.exec(statement.execution_options(yield_per=512)), 20)
 
             words = []
             for item, word in results:
@@ -120,8 +117,7 @@ class StudyService:
                 UserWordItem.user_id == user_id,
                 UserWordItem.status == 3
             )
-            results = session.exec(statement).all()
-            results = random.sample(results, min(100, len(results)))
+            results = reservoir_sample(session.exec(statement.execution_options(yield_per=512)), 100)
 
             words = []
             for item, word in results:
@@ -19,9 +19,9 @@ class TTSService:
         word_hash = hashlib.md5(word.encode()).hexdigest()
         cache_file = self.cache_dir / f"{word_hash}.mp3"
         
-        # 检查缓存
-        if cache_file.exists():
-            return cache_file.read_bytes()
+        # 检查缓存（文件读写放到线程池，避免阻塞事件循环）
+        if await asyncio.to_thread(cache_file.exists):
+            return await asyncio.to_thread(cache_file.read_bytes)
         
         # 生成音频
         try:
@@ -33,8 +33,9 @@ class TTSService:
                     await communicate.save(str(cache_file))
                     
                     # 验证文件是否生成成功
-                    if cache_file.exists() and cache_file.stat().st_size > 0:
-                        return cache_file.read_bytes()
+                    audio_data = await asyncio.to_thread(cache_file.read_bytes)
+                    if audio_data:
+                        return audio_data
                     
                 except Exception as e:
                     if attempt < max_retries - 1:
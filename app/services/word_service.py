@@ -1,9 +1,12 @@
 """单词管理服务（重构版：支持单词本分类管理）"""
+from sqlalchemy import insert
 from sqlmodel import Session, select
 from app.models import WordBook, UserWordItem, User, WordCollection
 from app.services.llm_service import get_llm_service_for_user
 from app.services.message_service import MessageService
+from app.services.collection_service import CollectionService
 from app.database import engine
+from app.utils.ids import uuid7
 from typing import List, Dict, Any
 import uuid as uuid_pkg
 import logging
@@ -12,6 +15,28 @@ from fastapi import HTTPException
 logger = logging.getLogger(__name__)
 
 class WordService:
+    @staticmethod
+    def _bulk_create_items(
+        session: Session,
+        collection_id: uuid_pkg.UUID,
+        user_id: uuid_pkg.UUID,
+        word_ids: List[uuid_pkg.UUID]
+    ):
+        """批量创建学习条目（单条多行 INSERT，不逐行走 ORM 工作单元）"""
+        if not word_ids:
+            return
+        rows = [
+            {
+                "id": uuid7(),
+                "collection_id": collection_id,
+                "user_id": user_id,
+                "word_id": word_id,
+                "status": 0
+            }
+            for word_id in word_ids
+        ]
+        session.exec(insert(UserWordItem), params=rows)
+
     @staticmethod
     async def import_words_background_task(
         user_id: uuid_pkg.UUID,
@@ -32,9 +57,9 @@ class WordService:
                     logger.error(f"User {user_id} not found during background import")
                     return
 
-                # 获取单词本信息
+                # 获取单词本信息（接口层不再预先校验，由这里负责校验存在性和归属）
                 collection = session.get(WordCollection, collection_id)
-                if not collection:
+                if not collection or collection.user_id != user_id:
                     logger.error(f"Collection {collection_id} not found during background import")
                     # 尝试发送失败通知
                     MessageService.create_message(
@@ -91,7 +116,7 @@ class WordService:
     async def import_marketplace_book_background_task(
         user_id: uuid_pkg.UUID,
         collection_id: uuid_pkg.UUID,
-        marketplace_data: Dict[str, Any]
+        marketplace_json: str
     ):
         """
         后台任务：处理Marketplace单词本导入
@@ -119,7 +144,7 @@ class WordService:
                 result = await WordService.import_marketplace_book(
                     user=user,
                     collection_id=collection_id,
-                    marketplace_data=marketplace_data,
+                    marketplace_json=marketplace_json,
                     session=session
                 )
 
@@ -146,16 +171,19 @@ class WordService:
     async def import_marketplace_book(
         user: User,
         collection_id: uuid_pkg.UUID,
-        marketplace_data: Dict[str, Any],
+        marketplace_json: str,
         session: Session
     ) -> Dict[str, Any]:
         """
         导入Marketplace数据（使用JSON中的释义，不调用LLM）
+
+        marketplace_json 为接口层序列化后的 JSON 字符串，在此处才解析，
+        避免请求处理期间额外复制一份完整的字典数据
         """
         from app.schemas.marketplace import MarketplaceBookImport
 
         # 验证并转换输入数据
-        book_data = MarketplaceBookImport(**marketplace_data)
+        book_data = MarketplaceBookImport.model_validate_json(marketplace_json)
 
         # 准备单词映射字典 {word_str: detail_obj}
         market_words_map = {w.word.lower().strip(): w for w in book_data.words if w.word.strip()}
@@ -197,7 +225,8 @@ class WordService:
         words_to_create = [w for w in words_to_import if w not in existing_in_db_map]
 
         created_count = 0
-        new_word_entries = []
+        # 单词 -> WordBook ID（ID 由应用生成，无需提交后回读）
+        word_id_map = {w.word: w.id for w in existing_in_db}
 
         # 处理需要新建的单词 - 使用 JSON 中的数据
         for word_str in words_to_create:
@@ -215,30 +244,21 @@ class WordService:
                 content=content_json
             )
             session.add(word_entry)
-            new_word_entries.append(word_entry)
+            word_id_map[word_str] = word_entry.id
             created_count += 1
 
-        # 提交以生成 ID
-        if new_word_entries:
-            session.commit()
-            for w in new_word_entries:
-                session.refresh(w)
-
-            # 将新创建的也加入到 existing_in_db_map 方便后续处理
-            for w in new_word_entries:
-                existing_in_db_map[w.word] = w
+        # 先写入新建的单词，学习条目引用其 ID
+        if created_count:
+            session.flush()
 
         # 为用户在该单词本中创建学习条目
         # 包含：复用的 + 新创建的 (words_to_reuse + words_to_create = words_to_import)
-        for word_str in words_to_import:
-            word_entry = existing_in_db_map[word_str]
-            item = UserWordItem(
-                collection_id=collection_id,
-                user_id=user.id,
-                word_id=word_entry.id,
-                status=0
-            )
-            session.add(item)
+        WordService._bulk_create_items(
+            session,
+            collection_id,
+            user.id,
+            [word_id_map[word_str] for word_str in words_to_import]
+        )
 
         session.commit()
 
@@ -269,14 +289,8 @@ class WordService:
         5. 结果去重：确保最终结果不重复
         """
         # 验证单词本存在且属于该用户
-        # 注意：在后台任务调用时，已经在外部检查了，但保留此处检查无害
-        collection_statement = select(WordCollection).where(
-            WordCollection.id == collection_id,
-            WordCollection.user_id == user.id
-        )
-        collection = session.exec(collection_statement).first()
-        if not collection:
-            raise HTTPException(status_code=404, detail="单词本不存在")
+        # 注意：在后台任务调用时，已经在 import_words_background_task 中检查了，但保留此处检查无害
+        await CollectionService.assert_exists(collection_id, user.id, session)
 
         # 使用用户配置的LLM服务
         llm_service = get_llm_service_for_user(user)
@@ -326,9 +340,12 @@ class WordService:
         # 区分：可复用的单词 vs 需要LLM生成的新单词
         words_to_reuse = [w for w in words_to_import if w in existing_in_db_map]
         words_need_llm = [w for w in words_to_import if w not in existing_in_db_map]
+        # 在后续提交使对象过期之前取出复用单词的 ID
+        reuse_word_ids = [existing_in_db_map[w].id for w in words_to_reuse]
 
         # 第四步：仅对数据库中不存在的单词调用LLM（节省token）
         newly_created_words = []
+        newly_created_ids = []
         failed_words = []
 
         if words_need_llm:
@@ -345,46 +362,31 @@ class WordService:
                         )
                         session.add(word_entry)
                         newly_created_words.append(word)
+                        newly_created_ids.append(word_entry.id)
                     else:
                         failed_words.append(word)
 
                 session.commit()
             except Exception as e:
                 logger.error(f"LLM translation failed: {e}")
+                session.rollback()
                 # 如果批量翻译彻底失败，这些单词标记为失败
-                failed_words.extend(words_need_llm)
-
-        # 第五步：为用户在该单词本中创建学习条目
-        # 5.1 处理复用的单词
-        for word in words_to_reuse:
-            word_entry = existing_in_db_map[word]
-            item = UserWordItem(
-                collection_id=collection_id,
-                user_id=user.id,
-                word_id=word_entry.id,
-                status=0
-            )
-            session.add(item)
-
-        # 5.2 处理新创建的单词
-        if newly_created_words:
-            # 需要重新查询以获取ID
-            new_word_statement = select(WordBook).where(WordBook.word.in_(newly_created_words))
-            new_word_entries = session.exec(new_word_statement).all()
-
-            for word_entry in new_word_entries:
-                item = UserWordItem(
-                    collection_id=collection_id,
-                    user_id=user.id,
-                    word_id=word_entry.id,
-                    status=0
-                )
-                session.add(item)
+                newly_created_words.clear()
+                newly_created_ids.clear()
+                failed_words = list(words_need_llm)
+
+        # 第五步：为用户在该单词本中创建学习条目（复用的 + 新创建的，一次批量插入）
+        # 新建单词的 ID 由应用生成，已在创建时记录，无需重新查询
+        WordService._bulk_create_items(
+            session,
+            collection_id,
+            user.id,
+            reuse_word_ids + newly_created_ids
+        )
 
         session.commit()
 
-        # 更新单词本的单词数量（由数据库触发器自动处理，这里只是刷新）
-        session.refresh(collection)
+        # 单词本的单词数量由数据库触发器自动维护，无需刷新
 
         # 成功导入的数量 = 复用的 + 新生成的
         success_count = len(words_to_reuse) + len(newly_created_words)
@@ -399,7 +401,7 @@ class WordService:
         }
 
     @staticmethod
-    async def delete_word_item(
+    def delete_word_item(
         item_id: uuid_pkg.UUID,
         user_id: uuid_pkg.UUID,
         session: Session
@@ -418,7 +420,7 @@ class WordService:
         session.commit()
 
     @staticmethod
-    async def get_word_item(
+    def get_word_item(
         item_id: uuid_pkg.UUID,
         user_id: uuid_pkg.UUID,
         session: Session
@@ -9,7 +9,7 @@ import uuid as uuid_pkg
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
-    bcrypt__rounds=12
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
 )
 
 
@@ -21,6 +21,11 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def is_known_password_hash(hashed_password: Optional[str]) -> bool:
+    """判断哈希格式是否可被当前加密上下文识别（无法识别的哈希不可能校验通过）"""
+    return bool(hashed_password) and pwd_context.identify(hashed_password) is not None
+
+
 def get_password_hash(password: str) -> str:
     """生成密码哈希"""
     # 确保密码不超过72字节（bcrypt限制）
@@ -29,6 +34,10 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# 用户不存在时用于校验的占位哈希，使登录失败耗时与用户是否存在无关
+DUMMY_PASSWORD_HASH = get_password_hash(uuid_pkg.uuid4().hex)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """创建访问令牌"""
     to_encode = data.copy()
@@ -1,9 +1,12 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel import Session, select
-from app.database import get_session
+from app.database import get_session, get_async_session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Annotated, Optional
 from app.models import User, UserSession
 from app.utils.auth import decode_token
+from app.utils.user_cache import CachedUser, cache_user, get_cached_user
 from datetime import datetime
 import uuid as uuid_pkg
 
@@ -16,60 +19,105 @@ security = HTTPBearer(
 
 from app.config import settings
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: Session = Depends(get_session)
-) -> User:
-    """获取当前登录用户"""
-    token = credentials.credentials
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 
-    # Development Backdoor: Allow access with DEV_TOKEN from .env
+def _get_dev_user(token: str, session: Session) -> Optional[User]:
+    """Development Backdoor: Allow access with DEV_TOKEN from .env"""
     if settings.DEBUG and settings.DEV_TOKEN and token == settings.DEV_TOKEN:
         # Get the first user or a default admin user
-        user = session.exec(select(User)).first()
-        if user:
-            return user
         # If no user exists, we can't return a valid user object, so we fall through to normal auth
-        # or maybe raise a specific error saying "Create a user first"
+        return session.exec(select(User)).first()
+    return None
 
+
+def _decode_user_id(token: str) -> uuid_pkg.UUID:
+    """JWT 签名和有效期每次都校验，缓存只省去会话和用户查询"""
     payload = decode_token(token)
-    
     if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="无效的令牌",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    user_id: str = payload.get("sub")
+        raise _unauthorized("无效的令牌")
+
+    user_id = payload.get("sub")
     if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="无效的令牌",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
+        raise _unauthorized("无效的令牌")
+    try:
+        return uuid_pkg.UUID(user_id)
+    except ValueError:
+        raise _unauthorized("无效的令牌")
+
+
+async def _authenticate_from_db(token: str, user_id: uuid_pkg.UUID, session: Session) -> User:
+    """查询数据库校验会话并加载用户，通过后写入缓存"""
     # 验证会话是否存在且未过期
     statement = select(UserSession).where(
-        UserSession.user_id == uuid_pkg.UUID(user_id),
+        UserSession.user_id == user_id,
         UserSession.expires_at > datetime.utcnow()
     )
     user_session = session.exec(statement).first()
-    
+
     if not user_session:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="会话已过期，请重新登录",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
+        raise _unauthorized("会话已过期，请重新登录")
+
     # 获取用户信息
-    user = session.get(User, uuid_pkg.UUID(user_id))
+    user = session.get(User, user_id)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="用户不存在",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
+        raise _unauthorized("用户不存在")
+
+    await cache_user(token, user, user_session.expires_at)
     return user
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: Session = Depends(get_session)
+) -> User:
+    """获取当前登录用户（完整的数据库对象，需要修改用户或读取敏感字段时使用）"""
+    token = credentials.credentials
+
+    dev_user = _get_dev_user(token, session)
+    if dev_user:
+        return dev_user
+
+    user_id = _decode_user_id(token)
+
+    # 缓存命中说明会话已校验通过，只需按主键加载用户
+    cached_user = await get_cached_user(token)
+    if cached_user is not None and cached_user.id == user_id:
+        user = session.get(User, user_id)
+        if user is not None:
+            return user
+
+    return await _authenticate_from_db(token, user_id, session)
+
+
+async def get_current_user_cached(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: Session = Depends(get_session)
+) -> CachedUser:
+    """获取当前登录用户的基本资料（缓存命中时不查询数据库，只需要用户 ID 等基本信息的接口使用）"""
+    token = credentials.credentials
+
+    dev_user = _get_dev_user(token, session)
+    if dev_user:
+        return CachedUser.from_user(dev_user)
+
+    user_id = _decode_user_id(token)
+
+    cached_user = await get_cached_user(token)
+    if cached_user is not None and cached_user.id == user_id:
+        return cached_user
+
+    user = await _authenticate_from_db(token, user_id, session)
+    return CachedUser.from_user(user)
+
+
+# 常用依赖的类型别名，接口签名中直接使用
+SessionDep = Annotated[Session, Depends(get_session)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
+UserDep = Annotated[User, Depends(get_current_user)]
+CachedUserDep = Annotated[CachedUser, Depends(get_current_user_cached)]
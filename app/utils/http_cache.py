@@ -0,0 +1,38 @@
+"""
+HTTP 缓存工具
+
+为读多写少的接口生成带 Cache-Control 和 ETag 的 JSON 响应，
+客户端携带匹配的 If-None-Match 时直接返回 304，不再传输响应体。
+"""
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+
+def cached_json_response(request: Request, content: Any, max_age: int = 30) -> Response:
+    """
+    生成可缓存的 JSON 响应
+
+    Args:
+        request: 当前请求（读取 If-None-Match）
+        content: 响应内容
+        max_age: 浏览器缓存时间（秒）
+
+    Returns:
+        200 JSON 响应，或 ETag 匹配时的 304 响应
+    """
+    body = orjson.dumps(content)
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    headers = {
+        # 响应因用户而异，只允许浏览器私有缓存
+        "Cache-Control": f"private, max-age={max_age}",
+        "ETag": etag,
+        "Vary": "Authorization",
+    }
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,21 @@
+"""
+主键 ID 生成
+
+UUIDv7 高 48 位为毫秒时间戳，按时间单调递增，插入时集中在 B-tree 索引最右侧页面，
+避免 uuid4 随机主键造成的页分裂和缓冲池抖动；长度与唯一性和 uuid4 相同。
+"""
+import os
+import time
+import uuid as uuid_pkg
+
+
+def uuid7() -> uuid_pkg.UUID:
+    """生成 UUIDv7（RFC 9562：48 位毫秒时间戳 + 版本号 + 74 位随机数）"""
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    # 版本号 7
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    # 变体 10xx
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid_pkg.UUID(int=value)
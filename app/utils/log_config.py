@@ -0,0 +1,33 @@
+"""
+日志配置
+
+uvicorn 只配置自己的 uvicorn.* 日志器，根日志器默认为 WARNING 且没有处理器，
+应用内 logging.getLogger(__name__)（app.*）和启动信息（wordmaster）的 INFO 日志会被丢弃。
+API 进程和 ARQ worker 启动时调用 configure_logging，为这两个日志器挂上处理器。
+"""
+import logging.config
+
+from app.config import settings
+
+
+def configure_logging():
+    """为 app.* 和 wordmaster 日志器配置输出到标准错误的处理器"""
+    logging.config.dictConfig({
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {
+            "default": {
+                "format": "%(asctime)s %(levelname)s [%(name)s] %(message)s",
+            },
+        },
+        "handlers": {
+            "default": {
+                "class": "logging.StreamHandler",
+                "formatter": "default",
+            },
+        },
+        "loggers": {
+            name: {"handlers": ["default"], "level": settings.LOG_LEVEL.upper(), "propagate": False}
+            for name in ("app", "wordmaster")
+        },
+    })
@@ -0,0 +1,28 @@
+"""
+游标（keyset）分页工具
+
+游标为最后一条记录 (created_at, id) 的 base64 编码，下一页通过
+`(created_at, id) < 游标` 条件定位，避免 OFFSET 扫描并丢弃前面的行。
+"""
+import base64
+from datetime import datetime
+from typing import Tuple
+
+from fastapi import HTTPException
+import uuid as uuid_pkg
+
+
+def encode_cursor(created_at: datetime, record_id: uuid_pkg.UUID) -> str:
+    """将 (created_at, id) 编码为游标字符串"""
+    raw = f"{created_at.isoformat()}|{record_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid_pkg.UUID]:
+    """解析游标字符串，格式错误时返回 400"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, record_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), uuid_pkg.UUID(record_id)
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="无效的分页游标")
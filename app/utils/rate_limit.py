@@ -0,0 +1,36 @@
+"""
+速率限制器
+
+全局唯一的 Limiter 实例：main.py 将其挂载到 app.state.limiter，
+各路由模块导入同一实例使用 @limiter.limit(...)，共享同一份计数存储。
+"""
+from fastapi import Request
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from app.config import settings
+
+
+def real_ip(request: Request) -> str:
+    """
+    获取客户端真实 IP
+
+    部署在反向代理（nginx/Traefik/Cloudflare）之后时，request.client.host 始终是代理地址，
+    所有用户会共用同一个限流桶。仅在 TRUST_PROXY_HEADERS 开启时读取代理头，
+    否则客户端可伪造请求头绕过限流。
+    """
+    if settings.TRUST_PROXY_HEADERS:
+        forwarded_ip = (
+            request.headers.get("cf-connecting-ip")
+            or request.headers.get("x-forwarded-for", "").split(",")[0].strip()
+        )
+        if forwarded_ip:
+            return forwarded_ip
+    return get_remote_address(request)
+
+
+# 基于客户端 IP 地址限制；配置 REDIS_URL 后计数器存储在 Redis，多个 worker 间共享
+limiter = Limiter(
+    key_func=real_ip,
+    storage_uri=settings.REDIS_URL or "memory://",
+)
@@ -0,0 +1,30 @@
+"""
+Redis 客户端
+
+未配置 REDIS_URL 时 get_redis() 返回 None，调用方应退化为不使用缓存。
+"""
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from app.config import settings
+
+_redis: Optional[Redis] = None
+
+
+def get_redis() -> Optional[Redis]:
+    """获取（懒加载）全局 Redis 客户端，未配置时返回 None"""
+    global _redis
+    if not settings.REDIS_URL:
+        return None
+    if _redis is None:
+        _redis = Redis.from_url(settings.REDIS_URL)
+    return _redis
+
+
+async def close_redis():
+    """关闭 Redis 客户端（应用关闭时调用）"""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
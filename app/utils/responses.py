@@ -0,0 +1,19 @@
+"""
+自定义响应类
+"""
+from fastapi import Response
+from pydantic import BaseModel
+
+
+class PydanticResponse(Response):
+    """
+    直接使用 pydantic-core 序列化模型的 JSON 响应
+
+    路由需直接返回 PydanticResponse(model)，跳过 FastAPI 的
+    jsonable_encoder 和 response_model 二次校验；UUID、datetime
+    等字段由 pydantic-core 原生序列化。
+    """
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode("utf-8")
@@ -0,0 +1,50 @@
+"""
+随机抽样工具
+
+蓄水池抽样（Algorithm L）：从长度未知的流中等概率抽取 k 个元素，只保留 k 个元素在内存中，
+并且按几何分布直接跳过不会被选中的元素，随机数调用次数为 O(k(1 + log(N/k)))。
+配合查询的 yield_per 使用时，不需要先把全部结果取回到列表中再调用 random.sample。
+"""
+import math
+import random
+from itertools import islice
+from typing import Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+_SENTINEL = object()
+
+
+def _random_open() -> float:
+    """返回 (0, 1) 区间内的随机数，避免对 0 取对数"""
+    u = random.random()
+    while u == 0.0:
+        u = random.random()
+    return u
+
+
+def reservoir_sample(iterable: Iterable[T], k: int) -> List[T]:
+    """
+    从可迭代对象中等概率抽取 k 个元素（不足 k 个时返回全部），结果顺序随机，
+    与 random.sample(list(iterable), min(k, n)) 的分布相同
+    """
+    if k <= 0:
+        return []
+
+    it = iter(iterable)
+    reservoir = list(islice(it, k))
+
+    if len(reservoir) == k:
+        w = math.exp(math.log(_random_open()) / k)
+        while True:
+            # 跳过 skip 个元素，下一个元素替换蓄水池中的随机位置
+            skip = math.floor(math.log(_random_open()) / math.log1p(-w))
+            item = next(islice(it, skip, skip + 1), _SENTINEL)
+            if item is _SENTINEL:
+                break
+            reservoir[random.randrange(k)] = item
+            w *= math.exp(math.log(_random_open()) / k)
+
+    # 蓄水池中的位置与元素在流中的顺序有关，打乱后与 random.sample 的输出一致
+    random.shuffle(reservoir)
+    return reservoir
@@ -0,0 +1,53 @@
+"""
+后台任务队列
+
+配置 REDIS_URL 后，任务投递到 ARQ 队列，由独立的 worker 进程执行（见 app/worker.py）；
+未配置时退化为 FastAPI BackgroundTasks，在当前进程内执行。
+"""
+from typing import Any, Callable, Optional
+
+from arq import create_pool
+from arq.connections import ArqRedis, RedisSettings
+from fastapi import BackgroundTasks
+
+from app.config import settings
+
+_arq_pool: Optional[ArqRedis] = None
+
+
+async def get_arq_pool() -> ArqRedis:
+    """获取（懒加载）ARQ Redis 连接池"""
+    global _arq_pool
+    if _arq_pool is None:
+        _arq_pool = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+    return _arq_pool
+
+
+async def close_arq_pool():
+    """关闭 ARQ 连接池（应用关闭时调用）"""
+    global _arq_pool
+    if _arq_pool is not None:
+        await _arq_pool.close()
+        _arq_pool = None
+
+
+async def enqueue_task(
+    background_tasks: BackgroundTasks,
+    job_name: str,
+    func: Callable[..., Any],
+    **kwargs: Any
+):
+    """
+    提交后台任务
+
+    Args:
+        background_tasks: 请求的 BackgroundTasks（未配置 Redis 时使用）
+        job_name: worker 中注册的任务名
+        func: 本地执行时调用的函数
+        **kwargs: 任务参数（需可序列化，不能包含数据库会话）
+    """
+    if settings.REDIS_URL:
+        pool = await get_arq_pool()
+        await pool.enqueue_job(job_name, **kwargs)
+    else:
+        background_tasks.add_task(func, **kwargs)
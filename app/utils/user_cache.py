@@ -0,0 +1,114 @@
+"""
+当前用户缓存
+
+get_current_user 每个请求都要查询会话表和用户表，这里把校验通过的结果缓存到 Redis：
+- usr_tok:{token 哈希} -> {user_id, 会话过期时间}，表示该令牌的会话已校验通过
+- usr:{user_id} -> 用户基本资料 JSON（不含密码哈希、LLM API Key 等敏感字段）
+- usr_toks:{user_id} -> 该用户已缓存的令牌键集合，用于失效时一并删除
+
+令牌键的有效期不超过会话剩余时间，命中时还会再检查会话过期时间，会话过期后缓存不再生效。
+用户资料变更、修改密码、登出时调用 invalidate_user_cache 使缓存失效。
+未配置 REDIS_URL 或 Redis 不可用时所有函数静默退化为不使用缓存。
+"""
+import hashlib
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+import orjson
+from pydantic import BaseModel, ConfigDict
+
+from app.models import User
+from app.utils.redis_client import get_redis
+import uuid as uuid_pkg
+
+logger = logging.getLogger(__name__)
+
+# 缓存时间（秒），登出/吊销在失效未覆盖到的情况下最多延迟这么久生效
+USER_CACHE_TTL = 60
+
+
+class CachedUser(BaseModel):
+    """缓存中的用户基本资料（只读投影，不是数据库模型，不能用于更新用户）"""
+    model_config = ConfigDict(frozen=True)
+
+    id: uuid_pkg.UUID
+    username: str
+    email: str
+    nickname: Optional[str] = None
+    avatar_url: Optional[str] = None
+    use_default_llm: bool = True
+
+    @classmethod
+    def from_user(cls, user: User) -> "CachedUser":
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            nickname=user.nickname,
+            avatar_url=user.avatar_url,
+            use_default_llm=user.use_default_llm
+        )
+
+
+def _token_key(token: str) -> str:
+    return "usr_tok:" + hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def get_cached_user(token: str) -> Optional[CachedUser]:
+    """根据令牌读取缓存的用户资料，未命中或会话已过期返回 None"""
+    redis = get_redis()
+    if redis is None:
+        return None
+
+    try:
+        token_data = await redis.get(_token_key(token))
+        if not token_data:
+            return None
+        token_entry = orjson.loads(token_data)
+        if token_entry["exp"] <= time.time():
+            return None
+        user_data = await redis.get(f"usr:{token_entry['uid']}")
+        if not user_data:
+            return None
+        return CachedUser.model_validate_json(user_data)
+    except Exception as e:
+        logger.warning(f"User cache read failed: {e}")
+        return None
+
+
+async def cache_user(token: str, user: User, session_expires_at: datetime):
+    """缓存校验通过的令牌和用户基本资料（session_expires_at 为会话过期时间，UTC）"""
+    redis = get_redis()
+    if redis is None:
+        return
+
+    expires_ts = session_expires_at.replace(tzinfo=timezone.utc).timestamp()
+    ttl = min(USER_CACHE_TTL, int(expires_ts - time.time()))
+    if ttl <= 0:
+        return
+
+    token_key = _token_key(token)
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.set(token_key, orjson.dumps({"uid": str(user.id), "exp": expires_ts}), ex=ttl)
+            pipe.set(f"usr:{user.id}", CachedUser.from_user(user).model_dump_json(), ex=USER_CACHE_TTL)
+            pipe.sadd(f"usr_toks:{user.id}", token_key)
+            pipe.expire(f"usr_toks:{user.id}", USER_CACHE_TTL)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"User cache write failed: {e}")
+
+
+async def invalidate_user_cache(user_id: uuid_pkg.UUID):
+    """使用户的所有缓存失效（用户数据变更、修改密码、登出时调用）"""
+    redis = get_redis()
+    if redis is None:
+        return
+
+    try:
+        token_keys = await redis.smembers(f"usr_toks:{user_id}")
+        await redis.delete(f"usr:{user_id}", f"usr_toks:{user_id}", *token_keys)
+    except Exception as e:
+        logger.warning(f"User cache invalidation failed: {e}")
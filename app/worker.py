@@ -0,0 +1,83 @@
+"""
+ARQ 后台任务 worker
+
+启动方式：arq app.worker.WorkerSettings
+
+与 API 进程分离运行，单词导入、试卷生成、阅卷等耗时的 LLM 任务
+不再占用 API 进程的事件循环和线程池。
+"""
+from typing import Any, Dict, List, Optional
+
+from arq.connections import RedisSettings
+
+from app.config import settings
+from app.services.exam_service import ExamService
+from app.services.word_service import WordService
+from app.utils.log_config import configure_logging
+import uuid as uuid_pkg
+
+
+async def import_words(ctx: Dict[str, Any], user_id: uuid_pkg.UUID, collection_id: uuid_pkg.UUID, words: List[str]):
+    """导入单词到单词本"""
+    await WordService.import_words_background_task(user_id=user_id, collection_id=collection_id, words=words)
+
+
+async def import_marketplace_book(
+    ctx: Dict[str, Any],
+    user_id: uuid_pkg.UUID,
+    collection_id: uuid_pkg.UUID,
+    marketplace_json: str
+):
+    """导入 Marketplace 单词本"""
+    await WordService.import_marketplace_book_background_task(
+        user_id=user_id,
+        collection_id=collection_id,
+        marketplace_json=marketplace_json
+    )
+
+
+async def generate_exam(
+    ctx: Dict[str, Any],
+    exam_id: uuid_pkg.UUID,
+    mode: str,
+    target_count: int,
+    specific_item_ids: Optional[List[uuid_pkg.UUID]] = None
+):
+    """生成试卷内容"""
+    await ExamService.process_exam_generation_task(
+        exam_id=exam_id,
+        mode=mode,
+        target_count=target_count,
+        specific_item_ids=specific_item_ids
+    )
+
+
+async def submit_exam(
+    ctx: Dict[str, Any],
+    exam_id: uuid_pkg.UUID,
+    user_id: uuid_pkg.UUID,
+    wrong_word_ids: List[uuid_pkg.UUID],
+    sentences_submission: List[Dict]
+):
+    """阅卷并更新学习进度"""
+    await ExamService.submit_exam_task(
+        exam_id=exam_id,
+        user_id=user_id,
+        wrong_word_ids=wrong_word_ids,
+        sentences_submission=sentences_submission
+    )
+
+
+async def startup(ctx: Dict[str, Any]):
+    """worker 启动时配置应用日志"""
+    configure_logging()
+
+
+class WorkerSettings:
+    """ARQ worker 配置"""
+    functions = [import_words, import_marketplace_book, generate_exam, submit_exam]
+    on_startup = startup
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL or "redis://localhost:6379/0")
+    # LLM 调用可能较慢，放宽单个任务的超时时间
+    job_timeout = 600
+    max_tries = 3
@@ -120,6 +120,8 @@ CREATE INDEX IF NOT EXISTS idx_items_status ON user_word_items(status);
 CREATE INDEX IF NOT EXISTS idx_items_next_review ON user_word_items(next_review_due) WHERE next_review_due IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_items_collection_status ON user_word_items(collection_id, status);
 CREATE INDEX IF NOT EXISTS idx_items_collection_review ON user_word_items(collection_id, next_review_due) WHERE status < 4;
+-- 试卷生成/复习可用性统计：按用户、单词本、状态过滤
+CREATE INDEX IF NOT EXISTS idx_items_user_collection_status ON user_word_items(user_id, collection_id, status);
 
 CREATE TRIGGER update_user_word_items_updated_at
     BEFORE UPDATE ON user_word_items
@@ -159,6 +161,8 @@ CREATE TABLE IF NOT EXISTS messages (
 
 CREATE INDEX IF NOT EXISTS idx_messages_user_id ON messages(user_id);
 CREATE INDEX IF NOT EXISTS idx_messages_created_at ON messages(created_at DESC);
+-- 消息列表/未读数：按用户和已读状态过滤、按时间倒序（已有数据的库可用 CREATE INDEX CONCURRENTLY 在线创建）
+CREATE INDEX IF NOT EXISTS idx_messages_user_read_created ON messages(user_id, is_read, created_at DESC, id DESC);
 
 -- 8. Create exams table
 CREATE TABLE IF NOT EXISTS exams (
@@ -178,6 +182,10 @@ CREATE TABLE IF NOT EXISTS exams (
 CREATE INDEX IF NOT EXISTS idx_exams_user_id ON exams(user_id);
 CREATE INDEX IF NOT EXISTS idx_exams_collection_id ON exams(collection_id);
 CREATE INDEX IF NOT EXISTS idx_exams_status ON exams(exam_status);
+-- 复习可用性/占用单词检查：按用户、状态、模式过滤
+CREATE INDEX IF NOT EXISTS idx_exams_user_status_mode ON exams(user_id, exam_status, mode);
+-- 考试列表：按用户过滤、按创建时间倒序
+CREATE INDEX IF NOT EXISTS idx_exams_user_created ON exams(user_id, created_at DESC);
 
 -- 9. Create exam_spelling_sections table
 CREATE TABLE IF NOT EXISTS exam_spelling_sections (